@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------
+# Eller's algorithm maze generator.
+# Builds the maze one row at a time, with memory bounded by the
+# number of columns, so mazes can be streamed straight to a file.
+#
+# Run from the project root to write a maze file:
+#   python -m generator.ellerGenerator <rows> <cols> <randWall> <file> [seed]
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import sys
+import random
+from math import exp
+from typing import Iterator, List, Optional, Tuple
+
+from maze.maze import Maze
+from maze.gridGraph import GridGraph
+from reader.mazeWriter import openMazeFile
+
+
+class EllerMazeGenerator():
+	"""
+	Eller's algorithm maze generator.
+	Produces a perfect maze, then knocks down extra walls as rows are emitted.
+	"""
+
+	def generateRows(self, rowNum: int, colNum: int, randWall: int) -> Iterator[Tuple[List[bool], Optional[List[bool]]]]:
+		"""
+		Generates the maze row by row, only ever holding the current row.
+
+		Each wall left standing by Eller's algorithm is then removed with probability 1 - exp(-2 * randWall / 100),
+		which is the fraction of walls the random removal of RecurBackMazeGenerator knocks down on large mazes.
+
+		@param rowNum: number of rows in the maze.
+		@param colNum: number of columns in the maze.
+		@param randWall: percentage of walls to remove, as for RecurBackMazeGenerator.
+
+		@return Iterator over (rightWalls, downWalls) per row: rightWalls[c] is the wall between (r, c) and
+			(r, c+1) for c < colNum-1, downWalls[c] the wall between (r, c) and (r+1, c); downWalls is None
+			for the last row.  Walls to the boundary ring are not included and always stay up.
+		"""
+		loopProb = 1 - exp(-2 * randWall / 100.0)
+
+		# set id of each cell in the current row; None for cells not joined to the row above
+		sets: List[Optional[int]] = [None] * colNum
+		nextSet = 0
+
+		for row in range(rowNum):
+			lastRow = row == rowNum - 1
+
+			# cells of each set in this row
+			members = {}
+			for col in range(colNum):
+				if sets[col] is None:
+					sets[col] = nextSet
+					nextSet += 1
+				members.setdefault(sets[col], []).append(col)
+
+			# randomly join adjacent cells of different sets; on the last row join all of them
+			rightWalls = [True] * (colNum - 1)
+			for col in range(colNum - 1):
+				if sets[col] != sets[col + 1] and (lastRow or random.random() < 0.5):
+					rightWalls[col] = False
+
+					# merge the smaller set into the larger one
+					keep, drop = sets[col], sets[col + 1]
+					if len(members[keep]) < len(members[drop]):
+						keep, drop = drop, keep
+					for member in members[drop]:
+						sets[member] = keep
+					members[keep].extend(members.pop(drop))
+
+			downWalls = None
+			if not lastRow:
+				# every set extends down through at least one cell
+				downWalls = [True] * colNum
+				for cols in members.values():
+					for col in random.sample(cols, random.randint(1, len(cols))):
+						downWalls[col] = False
+				sets = [sets[col] if not downWalls[col] else None for col in range(colNum)]
+
+			# extra loops
+			if loopProb > 0:
+				for col in range(colNum - 1):
+					if rightWalls[col] and random.random() < loopProb:
+						rightWalls[col] = False
+				if downWalls is not None:
+					for col in range(colNum):
+						if downWalls[col] and random.random() < loopProb:
+							downWalls[col] = False
+
+			yield rightWalls, downWalls
+
+
+	def generateMaze(self, maze: Maze, randWall: int):
+		"""
+		Generates a maze.  Will update the passed maze, which should have all walls up.
+
+		@param maze: Maze which we update on to generate a maze.
+		@param randWall: percentage of walls to remove.
+		"""
+		colNum = maze.colNum()
+		graph = maze.m_graph
+
+		for row, (rightWalls, downWalls) in enumerate(self.generateRows(maze.rowNum(), colNum, randWall)):
+			for col, wall in enumerate(rightWalls):
+				if not wall:
+					if isinstance(graph, GridGraph):
+						graph.writeWall(graph.m_vertWalls, row * (colNum + 1) + col + 1, False)
+					else:
+						maze.removeWall(maze.getCell(row, col), maze.getCell(row, col + 1))
+			if downWalls is not None:
+				for col, wall in enumerate(downWalls):
+					if not wall:
+						if isinstance(graph, GridGraph):
+							graph.writeWall(graph.m_horiWalls, (row + 1) * colNum + col, False)
+						else:
+							maze.removeWall(maze.getCell(row, col), maze.getCell(row + 1, col))
+
+
+	def writeMaze(self, fname: str, rowNum: int, colNum: int, randWall: int, weight: int = 1):
+		"""
+		Streams a generated maze to a text file in the format MazeReader reads, one row at a time.
+		The file is compressed if its name ends in .gz, .bz2 or .xz.
+		Even lines hold the cell weights of a row interleaved with the walls between its cells,
+		odd lines the walls between that row and the next (1 for a wall, 0 for none).
+
+		@param fname: maze file to write.
+		@param weight: weight of every cell.
+		"""
+		with openMazeFile(fname, 'w') as file:
+			for rightWalls, downWalls in self.generateRows(rowNum, colNum, randWall):
+				tokens = [str(weight)]
+				for wall in rightWalls:
+					tokens.append('1' if wall else '0')
+					tokens.append(str(weight))
+				file.write(' '.join(tokens) + '\n')
+
+				if downWalls is not None:
+					file.write(' '.join('1' if wall else '0' for wall in downWalls) + '\n')
+
+
+if __name__ == '__main__':
+	if len(sys.argv) not in (5, 6):
+		print('python3 -m generator.ellerGenerator', '<rows> <cols> <randWall> <file> [seed]')
+		sys.exit(1)
+
+	if len(sys.argv) == 6:
+		random.seed(int(sys.argv[5]))
+	EllerMazeGenerator().writeMaze(sys.argv[4], int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]))
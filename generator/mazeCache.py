@@ -0,0 +1,128 @@
+# -------------------------------------------------------------------
+# On-disk cache of generated mazes.
+# Each maze is stored as a binary maze file named by a hash of the
+# parameters it was generated with, so seeded runs can skip generation.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import os
+import json
+import hashlib
+import tempfile
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from maze.maze import Maze
+from reader.mazeReader import MazeReader
+from reader.mazeWriter import MazeWriter
+
+
+class MazeCache():
+	"""
+	Directory of generated mazes, one file per set of generation parameters.
+	Each file is a binary maze file as written by MazeWriter, gzip compressed unless compress is False,
+	and is loaded back with MazeReader.  Once the files take more than maxBytes, the least recently
+	used ones are evicted; a hit counts as a use.
+	"""
+
+	FILE_SUFFIX = '.maze'
+	VERSION = 2
+
+
+	def __init__(self, path: str, maxBytes: int = 256 * 1024 * 1024, compress: bool = True):
+		"""
+		Constructor.
+
+		@param path: directory of the cache files, created if needed.
+		@param maxBytes: total size of the cache files to evict down to.
+		@param compress: whether to gzip the cache files.
+		"""
+		if np is None:
+			raise Exception('NumPy is needed for the maze cache.')
+
+		self.m_path = path
+		self.m_maxBytes = maxBytes
+		self.m_compression = '.gz' if compress else ''
+		self.m_hits = 0
+		self.m_misses = 0
+		os.makedirs(path, exist_ok=True)
+
+
+	def makeKey(self, **params) -> str:
+		"""
+		@param params: everything that determines the generated maze, e.g., seed, dimensions and generator settings.
+
+		@return Hex digest identifying the maze generated with params.
+		"""
+		params['cacheVersion'] = self.VERSION
+		return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+	def fileName(self, key: str) -> str:
+		return os.path.join(self.m_path, key + self.FILE_SUFFIX + self.m_compression)
+
+
+	def load(self, key: str, maze: Maze) -> bool:
+		"""
+		Loads a cached maze into the passed maze, which should have the same dimensions.
+
+		@return True on a hit, False if key is not cached.
+		"""
+		fname = self.fileName(key)
+		if not os.path.exists(fname):
+			self.m_misses += 1
+			return False
+
+		MazeReader(fname).readBinary(maze, fname)
+
+		# mark as recently used
+		os.utime(fname)
+		self.m_hits += 1
+		return True
+
+
+	def store(self, key: str, maze: Maze):
+		"""
+		Stores a generated maze under key, then evicts least recently used files over the size limit.
+		"""
+		# write then rename, so an interrupted run never leaves a truncated entry; the temporary
+		# name keeps the compression extension MazeWriter goes by, but not the cache file suffix
+		fd, tmpName = tempfile.mkstemp(dir=self.m_path, suffix=self.m_compression)
+		os.close(fd)
+		MazeWriter(tmpName).writeMaze(maze)
+		os.replace(tmpName, self.fileName(key))
+
+		self.evict(keep=key)
+
+
+	def evict(self, keep: str = None):
+		"""
+		Deletes least recently used files until the cache fits in maxBytes.
+
+		@param keep: key never to evict, e.g., the one just stored.
+		"""
+		entries = []
+		for fname in os.listdir(self.m_path):
+			if fname.endswith((self.FILE_SUFFIX, self.FILE_SUFFIX + '.gz')):
+				stat = os.stat(os.path.join(self.m_path, fname))
+				entries.append((stat.st_mtime, stat.st_size, fname))
+
+		total = sum(size for _, size, _ in entries)
+		for _, size, fname in sorted(entries):
+			if total <= self.m_maxBytes:
+				break
+			if fname == os.path.basename(self.fileName(str(keep))):
+				continue
+			os.remove(os.path.join(self.m_path, fname))
+			total -= size
+
+
+	def hits(self) -> int:
+		return self.m_hits
+
+	def misses(self) -> int:
+		return self.m_misses
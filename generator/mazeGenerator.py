@@ -11,27 +11,62 @@ from maze.maze import Maze
 
 
 from generator.recurBackGenerator import RecurBackMazeGenerator
+from generator.ellerGenerator import EllerMazeGenerator
+from generator.tiledGenerator import TiledMazeGenerator
+from generator.mazeCache import MazeCache
 
 class MazeGenerator:
 	"""
 	Base class for a maze generator.
 	"""
-	def __init__(self, randWall:int = 0):
+	def __init__(self, randWall:int = 0, wallRemoval:str = "exact", generator:str = "recurBack", workers:int = None,
+				 cache:MazeCache = None):
 		# This is used to indicate to program whether a maze been generated, or nothing has been done.
 		# Need to set this to true once a maze is generated!
 		self.m_mazeGenerated: bool = False
 		self.m_randWall = randWall
-		self.m_generator = RecurBackMazeGenerator()
+		# "exact" reproduces seeded mazes, "batched" removes the random walls with vectorised draws
+		self.m_wallRemoval = wallRemoval
+		# "recurBack" (recursive backtracking), "eller" (row by row) or "tiled" (tiles carved by workers processes)
+		self.m_generatorName = generator
+		if generator == "recurBack":
+			self.m_generator = RecurBackMazeGenerator()
+		elif generator == "eller":
+			self.m_generator = EllerMazeGenerator()
+		elif generator == "tiled":
+			self.m_generator = TiledMazeGenerator(workers)
+		else:
+			raise Exception("Incorrect maze generator used.")
+		# optional on-disk cache of seeded mazes
+		self.m_cache = cache
 
 
-	def generateMaze(self, maze:Maze):
+	def generateMaze(self, maze:Maze, randSeed:int = None):
 		"""
 	    Generates a maze.  Will update the passed maze.
 
 		@param maze Maze which we update on to generate a maze. 
+		@param randSeed Seed the random generator was initialised with.  If set and there is a cache,
+			a maze generated before with the same seed and parameters is loaded rather than regenerated.
 		"""
 		
-		self.m_generator.generateMaze(maze, self.m_randWall)
+		cacheKey = None
+		if self.m_cache is not None and randSeed is not None:
+			cacheKey = self.m_cache.makeKey(randSeed=randSeed, rowNum=maze.rowNum(), colNum=maze.colNum(),
+											itemParams=maze.m_itemParams, randWall=self.m_randWall,
+											generator=self.m_generatorName, wallRemoval=self.m_wallRemoval,
+											entrances=[[c.getRow(), c.getCol()] for c in maze.getEntrances()],
+											exits=[[c.getRow(), c.getCol()] for c in maze.getExits()])
+			if self.m_cache.load(cacheKey, maze):
+				self.m_mazeGenerated = True
+				return
+
+		if self.m_generatorName == "eller":
+			self.m_generator.generateMaze(maze, self.m_randWall)
+		else:
+			self.m_generator.generateMaze(maze, self.m_randWall, self.m_wallRemoval)
+		if cacheKey is not None:
+			self.m_cache.store(cacheKey, maze)
 		self.m_mazeGenerated = True
 
 
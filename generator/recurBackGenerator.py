@@ -6,11 +6,19 @@
 # __copyright__ = 'Copyright 2025, RMIT University'
 # -------------------------------------------------------------------
 
-from random import choice
+from random import choice, getrandbits
 from collections import deque
+from array import array
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
 
 from maze.maze import Maze
 from maze.util import Coordinates
+from maze.gridGraph import GridGraph
+from maze.bitGridGraph import BitGridGraph
 
 
 
@@ -20,7 +28,12 @@ class RecurBackMazeGenerator():
 	Overrides genrateMaze of parent class.
 	"""
 
-	def generateMaze(self, maze: Maze, randWall: int):
+	def carvePassages(self, maze: Maze):
+		"""
+		Runs the recursive backtracking walk from a random cell, knocking down walls as it goes.
+
+		@param maze Maze with all walls up.
+		"""
 
 		# Select a random starting cell from the initialized maze cells
 		
@@ -65,9 +78,129 @@ class RecurBackMazeGenerator():
 				# backtrack
 				currCell = stack.pop()
 
+
+	def carveGrid(self, maze: Maze):
+		"""
+		Runs the recursive backtracking walk of generateMaze directly on the wall arrays of a GridGraph,
+		with cells as indices into a bytearray visited map and a preallocated array stack.
+		It draws the same random numbers as the walk on Coordinates, so a seeded run carves the same maze.
+
+		@param maze Maze backed by a GridGraph, with all walls up.
+		"""
+		graph: GridGraph = maze.m_graph
+		rowNum = maze.rowNum()
+		colNum = maze.colNum()
+		totalCells = rowNum * colNum
+		vertWalls = graph.m_vertWalls
+		horiWalls = graph.m_horiWalls
+		# one bit per wall rather than one byte, see BitGridGraph
+		packed = isinstance(graph, BitGridGraph)
+
+		# Select a random starting cell, as choice(maze.getCoords()) does. The first totalCells
+		# entries of maze.m_cells are the maze cells in row-major order, the rest are boundary cells.
+		numCoords = len(maze.m_cells)
+		start = choice(range(numCoords))
+		while start >= totalCells or maze.m_cells[divmod(start, colNum)].getWeight() == 0:
+			start = choice(range(numCoords))
+
+		# visited map over the cells and a ring of sentinel cells around them, marked visited so
+		# neighbours need no bounds checks; cell (r, c) is at (r+1) * width + c + 1
+		width = colNum + 2
+		visited = bytearray(b'\x01') * ((rowNum + 2) * width)
+		for r in range(rowNum):
+			visited[(r + 1) * width + 1:(r + 1) * width + 1 + colNum] = bytes(colNum)
+		row, col = divmod(start, colNum)
+		currCell = (row + 1) * width + col + 1
+		visited[currCell] = 1
+		numVisited = 1
+		# an int array rather than a list, so pushed cells do not each hold an int object
+		stack = array('q', bytes(8 * totalCells))
+		stack[0] = currCell
+		top = 0
+
+		while numVisited < totalCells:
+			# unvisited neighbours, in the order maze.neighbours gives them: left, right, up, down
+			nonVisitedNeighs = []
+			if not visited[currCell - 1]:
+				nonVisitedNeighs.append(currCell - 1)
+			if not visited[currCell + 1]:
+				nonVisitedNeighs.append(currCell + 1)
+			if not visited[currCell - width]:
+				nonVisitedNeighs.append(currCell - width)
+			if not visited[currCell + width]:
+				nonVisitedNeighs.append(currCell + width)
+
+			if nonVisitedNeighs:
+				# choice(nonVisitedNeighs), inlined: the random module draws an index below n as
+				# getrandbits(n.bit_length()) until it is below n
+				n = len(nonVisitedNeighs)
+				k = n.bit_length()
+				r = getrandbits(k)
+				while r >= n:
+					r = getrandbits(k)
+				neigh = nonVisitedNeighs[r]
+
+				# knock down the wall; cell (r, c) is r * colNum + c in the GridGraph wall indices,
+				# which is currCell - width - 1 - 2r here
+				row = currCell // width - 1
+				if neigh == currCell - 1:
+					idx = currCell - width - 1 - row
+					walls = vertWalls
+				elif neigh == currCell + 1:
+					idx = currCell - width - row
+					walls = vertWalls
+				elif neigh < currCell:
+					idx = currCell - width - 1 - 2 * row
+					walls = horiWalls
+				else:
+					idx = currCell - 3 - 2 * row
+					walls = horiWalls
+				if packed:
+					walls[idx >> 3] &= ~(1 << (idx & 7))
+				else:
+					walls[idx] = 0
+
+				top += 1
+				stack[top] = neigh
+				visited[neigh] = 1
+				numVisited += 1
+				currCell = neigh
+			else:
+				# backtrack
+				currCell = stack[top]
+				top -= 1
+
+
+	def generateMaze(self, maze: Maze, randWall: int, wallRemoval: str = "exact"):
+
+		if isinstance(maze.m_graph, GridGraph):
+			self.carveGrid(maze)
+		else:
+			self.carvePassages(maze)
+
+		if wallRemoval == "exact":
+			self.removeRandomWalls(maze, randWall)
+		elif wallRemoval == "batched":
+			self.removeRandomWallsBatched(maze, randWall)
+		else:
+			raise Exception("Incorrect wall removal used.")
+
+
+	def removeRandomWalls(self, maze: Maze, randWall: int):
+		"""
+		Removes random walls, so the maze has loops: repeatedly knocks down the wall between a random cell
+		and one of its neighbours, drawing each cell at most 4 times.
+
+		@param maze Maze with passages carved.
+		@param randWall Percentage of the cells to draw, times 4.
+		"""
+
 		num_cells = len(maze.m_cells)
-		cells = list(maze.m_cells)
 		numWallsToRemove = int((randWall / 100.0) * num_cells) * 4
+		if numWallsToRemove == 0:
+			# nothing to draw, so skip listing every cell
+			return
+		cells = list(maze.m_cells)
 		cell_counter = {}
 
 		while numWallsToRemove > 0 and len(cells) > 0:
@@ -96,4 +229,49 @@ class RecurBackMazeGenerator():
 
 			numWallsToRemove = numWallsToRemove - 1
 
-		
+
+	def removeRandomWallsBatched(self, maze: Maze, randWall: int):
+		"""
+		Vectorised counterpart of removeRandomWalls. All (cell, neighbour) draws are sampled up front with
+		NumPy, from a generator seeded by the random module so seeded runs stay reproducible, and the walls
+		are then cleared in bulk. Draws follow the same scheme (each cell at most 4 times, boundary cells
+		never knock down a wall) but not the same random sequence, so the maze differs from the exact removal.
+
+		@param maze Maze with passages carved.
+		@param randWall Percentage of the cells to draw, times 4.
+		"""
+		if np is None:
+			raise Exception('NumPy is needed for batched wall removal.')
+
+		rowNum = maze.rowNum()
+		colNum = maze.colNum()
+		totalCells = rowNum * colNum
+		numCoords = len(maze.m_cells)
+		numWallsToRemove = min(int((randWall / 100.0) * numCoords) * 4, 4 * numCoords)
+
+		rng = np.random.default_rng(getrandbits(64))
+		# draw cells from 4 copies of each cell without replacement; indices past totalCells are boundary cells
+		cells = rng.choice(4 * numCoords, size=numWallsToRemove, replace=False) // 4
+		cells = cells[cells < totalCells]
+		# neighbour to knock through: 0 left, 1 right, 2 up, 3 down; walls to the boundary ring stay
+		directions = rng.integers(0, 4, size=cells.size)
+		rows, cols = np.divmod(cells, colNum)
+
+		left = (directions == 0) & (cols > 0)
+		right = (directions == 1) & (cols < colNum - 1)
+		up = (directions == 2) & (rows > 0)
+		down = (directions == 3) & (rows < rowNum - 1)
+
+		# wall indices as laid out in GridGraph
+		vertIdx = np.concatenate((cells[left] + rows[left], cells[right] + rows[right] + 1))
+		horiIdx = np.concatenate((cells[up], cells[down] + colNum))
+
+		if isinstance(maze.m_graph, GridGraph):
+			maze.m_graph.clearWalls(horiIdx, vertIdx)
+		else:
+			for idx in horiIdx.tolist():
+				row, col = divmod(idx, colNum)
+				maze.removeWall(maze.m_cells[(row - 1, col)], maze.m_cells[(row, col)])
+			for idx in vertIdx.tolist():
+				row, col = divmod(idx, colNum + 1)
+				maze.removeWall(maze.m_cells[(row, col - 1)], maze.m_cells[(row, col)])
@@ -0,0 +1,215 @@
+# -------------------------------------------------------------------
+# Tiled maze generator.
+# Carves a perfect maze per tile in a process pool, then stitches the
+# tiles together through a random spanning tree of the tile grid.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import os
+import random
+from random import getrandbits
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from maze.maze import Maze
+from maze.gridGraph import GridGraph
+from generator.recurBackGenerator import RecurBackMazeGenerator
+
+
+def carveTile(task: Tuple[int, int, int]) -> Tuple[bytes, bytes]:
+	"""
+	Carves a perfect maze in a standalone tile with recursive backtracking.  Runs in a worker process.
+
+	@param task: (rowNum, colNum, seed) of the tile.
+
+	@return (horiWalls, vertWalls) of the walls inside the tile, 1 for a wall: horiWalls[r * colNum + c]
+		is the wall between (r, c) and (r+1, c), vertWalls[r * (colNum-1) + c] the wall between (r, c) and (r, c+1).
+	"""
+	rowNum, colNum, seed = task
+	rng = random.Random(seed)
+	totalCells = rowNum * colNum
+	horiWalls = bytearray(b'\x01') * ((rowNum - 1) * colNum)
+	vertWalls = bytearray(b'\x01') * (rowNum * (colNum - 1))
+
+	currCell = rng.randrange(totalCells)
+	visited = bytearray(totalCells)
+	visited[currCell] = 1
+	numVisited = 1
+	stack = [currCell]
+	lastCol = colNum - 1
+
+	while numVisited < totalCells:
+		col = currCell % colNum
+		nonVisitedNeighs = []
+		if col > 0 and not visited[currCell - 1]:
+			nonVisitedNeighs.append(currCell - 1)
+		if col < lastCol and not visited[currCell + 1]:
+			nonVisitedNeighs.append(currCell + 1)
+		if currCell >= colNum and not visited[currCell - colNum]:
+			nonVisitedNeighs.append(currCell - colNum)
+		if currCell + colNum < totalCells and not visited[currCell + colNum]:
+			nonVisitedNeighs.append(currCell + colNum)
+
+		if nonVisitedNeighs:
+			neigh = nonVisitedNeighs[rng.randrange(len(nonVisitedNeighs))]
+			if neigh == currCell - colNum:
+				horiWalls[neigh] = 0
+			elif neigh == currCell + colNum:
+				horiWalls[currCell] = 0
+			elif neigh < currCell:
+				vertWalls[neigh - neigh // colNum] = 0
+			else:
+				vertWalls[currCell - currCell // colNum] = 0
+
+			stack.append(neigh)
+			visited[neigh] = 1
+			numVisited += 1
+			currCell = neigh
+		else:
+			currCell = stack.pop()
+
+	return bytes(horiWalls), bytes(vertWalls)
+
+
+class TiledMazeGenerator():
+	"""
+	Tiled maze generator.
+	Splits the maze into tileSize x tileSize tiles (smaller along the last row and column of tiles),
+	carves each in parallel, and opens one wall between the tiles joined by a random spanning tree of
+	the tile grid, so the maze stays fully connected.  All randomness is drawn from the random module
+	up front, so a seeded run gives the same maze whatever the number of workers.
+	"""
+
+	def __init__(self, workers: int = None, tileSize: int = 128):
+		"""
+		Constructor.
+
+		@param workers: number of worker processes, defaults to the number of cores.
+		@param tileSize: number of rows and columns of a tile.
+		"""
+		self.m_workers = workers
+		self.m_tileSize = tileSize
+
+
+	def generateMaze(self, maze: Maze, randWall: int, wallRemoval: str = "exact"):
+		"""
+		Generates a maze.  Will update the passed maze, which should have all walls up.
+
+		@param maze: Maze which we update on to generate a maze.
+		@param randWall: percentage of walls to remove after stitching, as for RecurBackMazeGenerator.
+		@param wallRemoval: how to remove the random walls, as for RecurBackMazeGenerator.
+		"""
+		rowNum = maze.rowNum()
+		colNum = maze.colNum()
+		rowStarts = list(range(0, rowNum, self.m_tileSize))
+		colStarts = list(range(0, colNum, self.m_tileSize))
+		tiles = [(r0, c0, min(self.m_tileSize, rowNum - r0), min(self.m_tileSize, colNum - c0))
+				 for r0 in rowStarts for c0 in colStarts]
+		tasks = [(tileRows, tileCols, getrandbits(64)) for _, _, tileRows, tileCols in tiles]
+
+		workers = self.m_workers or os.cpu_count() or 1
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			results = executor.map(carveTile, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+			for (r0, c0, tileRows, tileCols), (horiWalls, vertWalls) in zip(tiles, results):
+				self.copyTile(maze, r0, c0, tileCols, horiWalls, vertWalls)
+
+		self.stitchTiles(maze, rowStarts, colStarts)
+
+		generator = RecurBackMazeGenerator()
+		if wallRemoval == "exact":
+			generator.removeRandomWalls(maze, randWall)
+		elif wallRemoval == "batched":
+			generator.removeRandomWallsBatched(maze, randWall)
+		else:
+			raise Exception("Incorrect wall removal used.")
+
+
+	def copyTile(self, maze: Maze, r0: int, c0: int, tileCols: int, horiWalls: bytes, vertWalls: bytes):
+		"""
+		Opens the walls a tile carved in the maze.
+
+		@param r0: first row of the tile.
+		@param c0: first column of the tile.
+		@param tileCols: number of columns of the tile.
+		@param horiWalls: walls between vertically adjacent cells of the tile, as returned by carveTile.
+		@param vertWalls: walls between horizontally adjacent cells of the tile, as returned by carveTile.
+		"""
+		colNum = maze.colNum()
+		if np is not None and isinstance(maze.m_graph, GridGraph):
+			rows, cols = np.divmod(np.flatnonzero(np.frombuffer(horiWalls, dtype=np.uint8) == 0), tileCols)
+			horiIdx = (r0 + rows + 1) * colNum + c0 + cols
+			rows, cols = np.divmod(np.flatnonzero(np.frombuffer(vertWalls, dtype=np.uint8) == 0), max(1, tileCols - 1))
+			vertIdx = (r0 + rows) * (colNum + 1) + c0 + cols + 1
+			maze.m_graph.clearWalls(horiIdx, vertIdx)
+			return
+
+		for idx, wall in enumerate(horiWalls):
+			if not wall:
+				row, col = divmod(idx, tileCols)
+				self.openWall(maze, r0 + row, c0 + col, r0 + row + 1, c0 + col)
+		for idx, wall in enumerate(vertWalls):
+			if not wall:
+				row, col = divmod(idx, tileCols - 1)
+				self.openWall(maze, r0 + row, c0 + col, r0 + row, c0 + col + 1)
+
+
+	def stitchTiles(self, maze: Maze, rowStarts: list, colStarts: list):
+		"""
+		Joins the tiles along a random spanning tree of the tile grid, opening one random wall
+		on the border between each pair of joined tiles.
+
+		@param rowStarts: first row of each row of tiles.
+		@param colStarts: first column of each column of tiles.
+		"""
+		tileRowNum = len(rowStarts)
+		tileColNum = len(colStarts)
+		rowEnds = rowStarts[1:] + [maze.rowNum()]
+		colEnds = colStarts[1:] + [maze.colNum()]
+
+		# randomised depth first search over the tile grid
+		visited = {(0, 0)}
+		stack = [(0, 0)]
+		while stack:
+			tileRow, tileCol = stack[-1]
+			neighs = [(tileRow + dr, tileCol + dc) for dr, dc in ((0, -1), (0, 1), (-1, 0), (1, 0))
+					  if 0 <= tileRow + dr < tileRowNum and 0 <= tileCol + dc < tileColNum
+					  and (tileRow + dr, tileCol + dc) not in visited]
+			if not neighs:
+				stack.pop()
+				continue
+
+			neighRow, neighCol = random.choice(neighs)
+			if neighRow == tileRow:
+				# tiles side by side, open a wall on the column border
+				row = random.randrange(rowStarts[tileRow], rowEnds[tileRow])
+				col = max(colStarts[tileCol], colStarts[neighCol])
+				self.openWall(maze, row, col - 1, row, col)
+			else:
+				# tiles one above the other, open a wall on the row border
+				col = random.randrange(colStarts[tileCol], colEnds[tileCol])
+				row = max(rowStarts[tileRow], rowStarts[neighRow])
+				self.openWall(maze, row - 1, col, row, col)
+
+			visited.add((neighRow, neighCol))
+			stack.append((neighRow, neighCol))
+
+
+	def openWall(self, maze: Maze, row1: int, col1: int, row2: int, col2: int):
+		"""
+		Removes the wall between two adjacent maze cells, directly in the wall arrays for a GridGraph.
+		"""
+		graph = maze.m_graph
+		if isinstance(graph, GridGraph):
+			colNum = maze.colNum()
+			if row1 == row2:
+				graph.writeWall(graph.m_vertWalls, row1 * (colNum + 1) + min(col1, col2) + 1, False)
+			else:
+				graph.writeWall(graph.m_horiWalls, (min(row1, row2) + 1) * colNum + col1, False)
+		else:
+			maze.removeWall(maze.getCell(row1, col1), maze.getCell(row2, col2))
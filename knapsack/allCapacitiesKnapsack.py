@@ -0,0 +1,125 @@
+# -------------------------------------------------
+# 0/1 knapsack solved once for every capacity up to a maximum,
+# answering queries for any of them without solving again.
+# Also holds the row update and walk back shared by the
+# bit-packed dynamic programming solvers.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------
+
+from array import array
+from typing import Tuple
+
+
+def relaxRow(row: array, shift: int, gain: int, limit: int) -> bytearray:
+    """
+    Adds one item to a row of a 0/1 knapsack dynamic programming table, in place: entry i becomes
+    row[i - shift] + gain wherever that is strictly smaller and row[i - shift] <= limit, i.e., is reachable.
+    Entries are updated from high to low i, so each still holds the previous row when read.
+
+    @param row: entries of the table row, minimised.
+    @param shift: how far the item moves an entry, e.g., its weight.
+    @param gain: what the item adds to an entry, e.g., its value negated.
+    @param limit: largest entry that is reachable.
+
+    @return bit i (bit (i & 7) of byte (i >> 3)) set wherever the item was taken.
+    """
+    taken = bytearray((len(row) + 7) // 8)
+    for i in range(len(row) - 1, shift - 1, -1):
+        prev = row[i - shift]
+        if prev <= limit and prev + gain < row[i]:
+            row[i] = prev + gain
+            taken[i >> 3] |= 1 << (i & 7)
+    return taken
+
+
+def walkBack(taken: list, shifts: list, index: int) -> list:
+    """
+    Recovers the items behind an entry of the last row, following the bits relaxRow returned back through the rows.
+
+    @param taken: bits relaxRow returned for each item, in the order the items were added.
+    @param shifts: shift of each item.
+    @param index: entry of the last row.
+
+    @return indices of the items taken, in the order they were added.
+    """
+    chosen = []
+    for i in range(len(taken) - 1, -1, -1):
+        if taken[i][index >> 3] >> (index & 7) & 1:
+            chosen.append(i)
+            index -= shifts[i]
+    chosen.reverse()
+    return chosen
+
+
+class AllCapacitiesKnapsack:
+    """
+    Runs the exact-weight dynamic programming of the dynamic knapsack solvers once, at the maximum
+    capacity, keeping the last row of values and one bit per item and weight recording whether the
+    item was taken.  The optimum for any capacity up to the maximum is then read off the last row and
+    its items recovered by walking back through the bits, in O(number of items).
+    """
+
+    def __init__(self, items: list, maxCapacity: int):
+        """
+        Constructor.
+
+        @param items: list of (name, weight, value), as built by Knapsack.itemList.
+        @param maxCapacity: largest capacity that can be queried.
+        """
+        self.m_maxCapacity = maxCapacity
+        self.m_items = []
+        # best value using exactly weight w of the items, negated so relaxRow minimises it; 1 if no subset weighs w
+        self.m_row = array('q', [1]) * (maxCapacity + 1)
+        self.m_row[0] = 0
+        # per item, bit w is set if the item is taken in the best subset of exactly weight w
+        self.m_taken = []
+        # lightest weight within each capacity with the best value, rebuilt on the next query after a change
+        self.m_bestWeights = None
+
+        for item in items:
+            self.addItem(item)
+
+
+    def addItem(self, item: list):
+        """
+        Adds an item on top of the current ones, at the cost of one row of the dynamic programming table.
+
+        @param item: (name, weight, value) of the item.
+        """
+        _, weight, value = item
+        self.m_taken.append(relaxRow(self.m_row, weight, -value, 0))
+        self.m_items.append(item)
+        self.m_bestWeights = None
+
+
+    def values(self) -> list:
+        """
+        @return best value using exactly each weight with the current items, None if no subset has that weight;
+            a row of the dynamicKnapsack table.
+        """
+        return [(-val if val <= 0 else None) for val in self.m_row]
+
+
+    def query(self, capacity: int) -> Tuple[list, int, int]:
+        """
+        @param capacity: capacity of the knapsack, at most the maximum capacity.
+
+        @return (optimalCells, optimalWeight, optimalValue) for the capacity, as Knapsack.solveKnapsack sets them;
+            of the best subsets, the lightest.
+        """
+        if capacity < 0 or capacity > self.m_maxCapacity:
+            raise Exception('Capacity is outside the range that was solved.')
+
+        if self.m_bestWeights is None:
+            self.m_bestWeights = array('q', [0]) * (self.m_maxCapacity + 1)
+            best = 0
+            for w in range(self.m_maxCapacity + 1):
+                if self.m_row[w] < self.m_row[best]:
+                    best = w
+                self.m_bestWeights[w] = best
+
+        weight = self.m_bestWeights[capacity]
+        chosen = walkBack(self.m_taken, [item[1] for item in self.m_items], weight)
+
+        return [self.m_items[i][0] for i in chosen], weight, -self.m_row[weight]
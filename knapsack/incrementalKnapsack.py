@@ -0,0 +1,97 @@
+# -------------------------------------------------
+# 0/1 knapsack kept up to date as items are added to and
+# removed from a maze, without solving from scratch.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------
+
+from array import array
+from typing import Tuple
+
+from maze.maze import Maze
+from knapsack.allCapacitiesKnapsack import AllCapacitiesKnapsack
+
+
+class IncrementalKnapsack(AllCapacitiesKnapsack):
+    """
+    Knapsack whose items can change between solves.  Adding an item costs one row of the dynamic
+    programming table.  The value row is checkpointed every checkpointEvery items, so removing an item
+    restores the last checkpoint before it and replays only the items added after that checkpoint.
+    """
+
+    def __init__(self, items: list, capacity: int, checkpointEvery: int = 16):
+        """
+        Constructor.
+
+        @param items: list of (name, weight, value), as built by Knapsack.itemList.
+        @param capacity: the maximum weight the knapsack can hold.
+        @param checkpointEvery: number of items between checkpoints of the value row; removal replays at most this many
+            items plus those after the removed one.
+        """
+        if checkpointEvery < 1:
+            raise Exception('Incorrect checkpoint interval used.')
+        self.m_checkpointEvery = checkpointEvery
+        # value row after the first k items, for k a multiple of checkpointEvery
+        self.m_checkpoints = {0: None}
+        super().__init__([], capacity)
+        self.m_checkpoints[0] = array('q', self.m_row)
+
+        for item in items:
+            self.addItem(item)
+
+
+    def addItem(self, item: list):
+        """
+        Adds an item, at the cost of one row of the dynamic programming table.
+
+        @param item: (name, weight, value) of the item.
+        """
+        super().addItem(item)
+        if len(self.m_items) % self.m_checkpointEvery == 0:
+            self.m_checkpoints[len(self.m_items)] = array('q', self.m_row)
+
+
+    def removeItem(self, name):
+        """
+        Removes an item, rebuilding the table from the last checkpoint before it.
+
+        @param name: name (cell) of the item to remove.
+        """
+        index = next((i for i, item in enumerate(self.m_items) if item[0] == name), None)
+        if index is None:
+            raise Exception('Item is not in the knapsack.')
+
+        base = index - index % self.m_checkpointEvery
+        replay = self.m_items[base:index] + self.m_items[index + 1:]
+        for k in [k for k in self.m_checkpoints if k > base]:
+            del self.m_checkpoints[k]
+        del self.m_items[base:]
+        del self.m_taken[base:]
+        self.m_row = array('q', self.m_checkpoints[base])
+        self.m_bestWeights = None
+
+        for item in replay:
+            self.addItem(item)
+
+
+    def syncItems(self, maze: Maze):
+        """
+        Adds and removes items so that they match the items of the maze, keeping the items that did not change.
+
+        @param maze: The maze we are considering
+        """
+        current = {name: [weight, value] for name, weight, value in self.m_items}
+        for name, weightValue in current.items():
+            if name not in maze.m_items or list(maze.m_items[name]) != weightValue:
+                self.removeItem(name)
+        for name in sorted(maze.m_items.keys()):
+            weight, value = maze.m_items[name]
+            if current.get(name) != [weight, value]:
+                self.addItem([name, weight, value])
+
+
+    def optimum(self) -> Tuple[list, int, int]:
+        """
+        @return (optimalCells, optimalWeight, optimalValue) for the full capacity, as Knapsack.solveKnapsack sets them.
+        """
+        return self.query(self.m_maxCapacity)
@@ -8,7 +8,37 @@
 # -------------------------------------------------
 
 import csv
+import math
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from maze.maze import Maze
+from knapsack.allCapacitiesKnapsack import AllCapacitiesKnapsack, relaxRow, walkBack
+from knapsack.incrementalKnapsack import IncrementalKnapsack
+
+
+class KnapsackStats:
+    """
+    Counters of a single run of a recursive knapsack solver.
+    """
+
+    def __init__(self):
+        # number of calls, including those answered from the cache
+        self.calls = 0
+        self.cacheHits = 0
+        # deepest level of recursion reached, the first call being at depth 1
+        self.peakDepth = 0
+        # whether the call count has been logged on the first base case
+        self.logged = False
+
+    def __str__(self) -> str:
+        return f'{self.calls} calls, {self.cacheHits} cache hits, peak recursion depth {self.peakDepth}'
 
 
 class Knapsack:
@@ -16,12 +46,18 @@ class Knapsack:
     Base class for the knapsack.
     """
 
-    def __init__(self, capacity: int, knapsackSolver: str):
+    def __init__(self, capacity: int, knapsackSolver: str, saveTable: bool = False, cacheSize: int = 2**20,
+                 epsilon: float = 0.1):
         """
         Constructor.
 
         @param capacity: the maximum weight the knapsack can hold
-        @param knapsackSolver: the method we wish to use to find optimal knapsack items (recur or dynamic)
+        @param knapsackSolver: the method we wish to use to find optimal knapsack items (recur, dynamic, dynamic-lean,
+            dynamic-numpy, dynamic-hirschberg, recur-memo, recur-iter, branch-bound, pareto, incremental or approx)
+        @param saveTable: whether solvers that do not need the full dynamic programming table should still build
+            it and save it as a csv
+        @param cacheSize: maximum number of subproblems the recur-memo solver keeps
+        @param epsilon: the approx solver finds a value of at least (1 - epsilon) times the optimum
         """
         # initialise variables
         self.capacity = capacity
@@ -29,18 +65,22 @@ class Knapsack:
         self.optimalWeight = 0
         self.optimalCells = []
         self.knapsackSolver = knapsackSolver
+        self.saveTable = saveTable
+        self.cacheSize = cacheSize
+        self.epsilon = epsilon
+        # for the approx solver, the most the optimal value can be; otherwise None, as optimalValue is the optimum
+        self.optimalBound: int = None
+        # counters of the last solve, for solvers that keep them
+        self.stats: KnapsackStats = None
+        # table kept between solves by the incremental solver
+        self.incremental: IncrementalKnapsack = None
 
     def solveKnapsack(self, maze: Maze, filename: str):
         """
         Calls the method to calculate the optimal knapsack solution
         @param maze: The maze we are considering
         """
-        map = []
-        # Sort by row (i) first, then column (j)
-        sorted_items = sorted(maze.m_items.items(), key=lambda item: (item[0][0], item[0][1]))
-
-        for cell, (weight, value) in sorted_items:
-            map.append([cell, weight, value])
+        map = self.itemList(maze)
 
         if self.knapsackSolver == "recur":
             self.optimalCells, self.optimalWeight, self.optimalValue = self.recursiveKnapsack(map,
@@ -52,10 +92,89 @@ class Knapsack:
                                                                                             self.capacity,
                                                                                             len(map),
                                                                                             filename)
+        elif self.knapsackSolver == "dynamic-lean":
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.leanDynamicKnapsack(map,
+                                                                                                self.capacity,
+                                                                                                len(map),
+                                                                                                filename)
+        elif self.knapsackSolver == "dynamic-numpy":
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.numpyDynamicKnapsack(map,
+                                                                                                 self.capacity,
+                                                                                                 len(map),
+                                                                                                 filename)
+        elif self.knapsackSolver == "recur-memo":
+            self.stats = KnapsackStats()
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.memoKnapsack(map,
+                                                                                         self.capacity,
+                                                                                         len(map),
+                                                                                         filename,
+                                                                                         self.stats)
+        elif self.knapsackSolver == "recur-iter":
+            self.stats = KnapsackStats()
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.iterativeKnapsack(map,
+                                                                                              self.capacity,
+                                                                                              len(map),
+                                                                                              filename,
+                                                                                              self.stats)
+        elif self.knapsackSolver == "branch-bound":
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.branchBoundKnapsack(map,
+                                                                                                self.capacity,
+                                                                                                len(map))
+        elif self.knapsackSolver == "pareto":
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.paretoKnapsack(map,
+                                                                                           self.capacity,
+                                                                                           len(map))
+        elif self.knapsackSolver == "dynamic-hirschberg":
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.hirschbergKnapsack(map,
+                                                                                               self.capacity,
+                                                                                               len(map))
+        elif self.knapsackSolver == "approx":
+            self.optimalCells, self.optimalWeight, self.optimalValue, self.optimalBound = self.approxKnapsack(map,
+                                                                                                              self.capacity,
+                                                                                                              len(map),
+                                                                                                              self.epsilon)
+        elif self.knapsackSolver == "incremental":
+            # only the items that changed in the maze since the last solve are added or removed
+            if self.incremental is None or self.incremental.m_maxCapacity != self.capacity:
+                self.incremental = IncrementalKnapsack(map, self.capacity)
+            else:
+                self.incremental.syncItems(maze)
+            self.optimalCells, self.optimalWeight, self.optimalValue = self.incremental.optimum()
 
         else:
             raise Exception("Incorrect Knapsack Solver Used.")
 
+    def itemList(self, maze: Maze) -> list:
+        """
+        @param maze: The maze we are considering
+
+        @return list of [cell, weight, value] of the items in the maze, in the order the solvers consider them.
+        """
+        map = []
+        # Sort by row (i) first, then column (j)
+        sorted_items = sorted(maze.m_items.items(), key=lambda item: (item[0][0], item[0][1]))
+
+        for cell, (weight, value) in sorted_items:
+            map.append([cell, weight, value])
+
+        return map
+
+    def sweepCapacities(self, maze: Maze, capacities: list) -> list:
+        """
+        Solves the knapsack once for the largest of a list of capacities and reads off the optimum for each of them,
+        regardless of knapsackSolver.
+
+        @param maze: The maze we are considering
+        @param capacities: capacities to solve for
+
+        @return list of (optimalCells, optimalWeight, optimalValue), one per capacity.
+        """
+        if len(capacities) == 0:
+            return []
+
+        allCapacities = AllCapacitiesKnapsack(self.itemList(maze), max(capacities))
+        return [allCapacities.query(capacity) for capacity in capacities]
+
     def recursiveKnapsack(self, items: list, capacity: int, num_items: int, filename: str = None,
                           stats={'count': 0, 'logged': False}):
         """
@@ -90,6 +209,420 @@ class Knapsack:
 
         return [], 0, 0
 
+    def memoKnapsack(self, items: list, capacity: int, num_items: int, filename: str = None,
+                     stats: KnapsackStats = None):
+        """
+        Recursive 0/1 Knapsack memoised on (num_items, capacity), with a cache of at most cacheSize
+        subproblems that evicts the least recently used.  The recursion runs on an explicit stack of
+        frames, so any number of items fits within the interpreter's recursion limit.  Logs the call
+        count when the base case is first hit, as recursiveKnapsack does; items are included before
+        they are excluded, so the count is the one iterativeKnapsack logs.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        @param filename: where to save call count on first base case (used for testing)
+        @param stats: counters for this run, a new one if None
+        """
+        if stats is None:
+            stats = KnapsackStats()
+        cache = OrderedDict()
+
+        # frame stages
+        START, INCLUDED, EXCLUDED_ONLY, EXCLUDED = range(4)
+
+        def best(n: int, cap: int, runStats: KnapsackStats) -> int:
+            """
+            @return Best value of the first n items within capacity cap, including each item before excluding it,
+                in the order iterativeKnapsack makes its calls.
+            """
+            # frames are [num_items, capacity, stage, value with the item]
+            stack = [[n, cap, START, 0]]
+            runStats.calls += 1
+            runStats.peakDepth = max(runStats.peakDepth, 1)
+            # value returned by the last finished frame
+            result = 0
+
+            while stack:
+                frame = stack[-1]
+                n, cap, stage = frame[0], frame[1], frame[2]
+
+                if stage == START:
+                    # Base case
+                    if cap == 0 or n == 0:
+                        if not runStats.logged and filename:
+                            with open(filename + '.txt', "w") as f:
+                                f.write(str(runStats.calls))
+                            runStats.logged = True
+                        result = 0
+                        stack.pop()
+                        continue
+
+                    key = (n, cap)
+                    if key in cache:
+                        runStats.cacheHits += 1
+                        cache.move_to_end(key)
+                        result = cache[key]
+                        stack.pop()
+                        continue
+
+                    weight = items[n - 1][1]
+                    if weight > cap:
+                        # item n cannot fit, only exclude it
+                        frame[2] = EXCLUDED_ONLY
+                        stack.append([n - 1, cap, START, 0])
+                    else:
+                        frame[2] = INCLUDED
+                        stack.append([n - 1, cap - weight, START, 0])
+
+                elif stage == INCLUDED:
+                    frame[3] = result + items[n - 1][2]
+                    frame[2] = EXCLUDED
+                    stack.append([n - 1, cap, START, 0])
+
+                elif stage == EXCLUDED_ONLY:
+                    self.cacheResult(cache, (n, cap), result)
+                    stack.pop()
+                    continue
+
+                else:
+                    result = max(frame[3], result)
+                    self.cacheResult(cache, (n, cap), result)
+                    stack.pop()
+                    continue
+
+                runStats.calls += 1
+                runStats.peakDepth = max(runStats.peakDepth, len(stack))
+
+            return result
+
+        max_value = best(num_items, capacity, stats)
+
+        # item n is taken wherever it changes the best value, mostly answered from the cache;
+        # these lookups are counted apart, so stats only covers the solve
+        lookupStats = KnapsackStats()
+        lookupStats.logged = True
+        selected_items, selected_weight = [], 0
+        cap = capacity
+        for n in range(num_items, 0, -1):
+            if best(n, cap, lookupStats) != best(n - 1, cap, lookupStats):
+                selected_items.append(items[n - 1][0])
+                selected_weight += items[n - 1][1]
+                cap -= items[n - 1][1]
+        selected_items.reverse()
+
+        return selected_items, selected_weight, max_value
+
+    def cacheResult(self, cache: OrderedDict, key: tuple, value: int):
+        """
+        Stores a subproblem result in the memoKnapsack cache, evicting the least recently used beyond cacheSize.
+        """
+        cache[key] = value
+        if len(cache) > self.cacheSize:
+            cache.popitem(last=False)
+
+    def branchBoundKnapsack(self, items: list, capacity: int, num_items: int):
+        """
+        Branch-and-bound 0/1 Knapsack.  Searches take/skip decisions depth first over the items in order
+        of decreasing value density, pruning every branch whose fractional relaxation cannot beat the best
+        solution found so far.  Nothing is indexed by capacity, so the time depends on the number of items
+        (exponential at worst, usually far less) and not on how large the capacity and weights are.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        """
+        # items that fit on their own, densest first
+        order = [i for i in range(num_items) if items[i][1] <= capacity]
+        order.sort(key=lambda i: items[i][2] / items[i][1] if items[i][1] > 0 else float('inf'), reverse=True)
+        weights = [items[i][1] for i in order]
+        values = [items[i][2] for i in order]
+        n = len(order)
+
+        # prefix sums, to find the item the fractional relaxation splits by bisection
+        prefixWeights = [0] * (n + 1)
+        prefixValues = [0] * (n + 1)
+        for k in range(n):
+            prefixWeights[k + 1] = prefixWeights[k] + weights[k]
+            prefixValues[k + 1] = prefixValues[k] + values[k]
+
+        def upperBound(k: int, cap: int, value: int) -> int:
+            """
+            @return Best value reachable deciding items k onwards with capacity cap left, if items could be split.
+            """
+            j = bisect_right(prefixWeights, prefixWeights[k] + cap) - 1
+            bound = value + prefixValues[j] - prefixValues[k]
+            if j < n:
+                bound += (cap - prefixWeights[j] + prefixWeights[k]) * values[j] // weights[j]
+            return bound
+
+        best_value, best_taken = -1, None
+        # (next item, capacity left, value so far, taken items as a linked list of (item, rest))
+        stack = [(0, capacity, 0, None)]
+        while stack:
+            k, cap, value, taken = stack.pop()
+            if k == n:
+                if value > best_value:
+                    best_value, best_taken = value, taken
+                continue
+            if upperBound(k, cap, value) <= best_value:
+                continue
+
+            # pushed last so taking the item is explored first
+            stack.append((k + 1, cap, value, taken))
+            if weights[k] <= cap:
+                stack.append((k + 1, cap - weights[k], value + values[k], (k, taken)))
+
+        chosen = []
+        while best_taken is not None:
+            k, best_taken = best_taken
+            chosen.append(order[k])
+        chosen.sort()
+
+        selected_items = [items[i][0] for i in chosen]
+        selected_weight = sum(items[i][1] for i in chosen)
+        return selected_items, selected_weight, max(best_value, 0)
+
+    def bestValues(self, items: list, lo: int, hi: int, capacity: int):
+        """
+        Best value of a subset of items[lo:hi] within each capacity 0 to capacity, one dynamic programming
+        row updated in place per item (vectorised if NumPy is available).
+
+        @return Array of capacity + 1 values.
+        """
+        if np is not None:
+            row = np.zeros(capacity + 1, dtype=np.int64)
+            for _, weight, value in items[lo:hi]:
+                if weight <= capacity:
+                    np.maximum(row[weight:], row[:capacity + 1 - weight] + value, out=row[weight:])
+            return row
+
+        row = array('q', [0]) * (capacity + 1)
+        for _, weight, value in items[lo:hi]:
+            for w in range(capacity, weight - 1, -1):
+                if row[w - weight] + value > row[w]:
+                    row[w] = row[w - weight] + value
+        return row
+
+    def hirschbergKnapsack(self, items: list, capacity: int, num_items: int):
+        """
+        Dynamic 0/1 Knapsack that recovers the chosen items by divide and conquer (as in Hirschberg's algorithm)
+        instead of from a num_items x capacity table.  The best values of each half of the items are computed
+        for every capacity, the capacity is split where their sum is largest, and each half is solved on its
+        share.  Only O(capacity) values are held at a time, at the cost of O(num_items * capacity * log(num_items)) time.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        """
+        row = self.bestValues(items, 0, num_items, capacity)
+        max_value = int(row[capacity])
+        # lightest capacity with the best value, as the table solvers report; a subset reaching
+        # the best value within it weighs exactly that much
+        selected_weight = 0
+        while row[selected_weight] < max_value:
+            selected_weight += 1
+        del row
+
+        def solve(lo: int, hi: int, cap: int) -> list:
+            """
+            @return Indices of a best subset of items[lo:hi] within capacity cap.
+            """
+            if hi - lo == 1:
+                _, weight, value = items[lo]
+                return [lo] if weight <= cap and value > 0 else []
+
+            mid = (lo + hi) // 2
+            left = self.bestValues(items, lo, mid, cap)
+            right = self.bestValues(items, mid, hi, cap)
+            if np is not None:
+                split = int(np.argmax(left + right[::-1]))
+            else:
+                split = 0
+                for c in range(1, cap + 1):
+                    if left[c] + right[cap - c] > left[split] + right[cap - split]:
+                        split = c
+            del left, right
+            return solve(lo, mid, split) + solve(mid, hi, cap - split)
+
+        chosen = solve(0, num_items, selected_weight) if num_items > 0 else []
+        return [items[i][0] for i in chosen], selected_weight, max_value
+
+    def paretoKnapsack(self, items: list, capacity: int, num_items: int):
+        """
+        Sparse 0/1 Knapsack that keeps only the Pareto frontier of (weight, value) states: after each item,
+        the subsets no other subset beats with at most the same weight.  The frontier is merged with the
+        frontier shifted by the item in one linear sweep, so the work follows the number of distinct useful
+        weights rather than the capacity.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        """
+        # (weight, value, taken items as a linked list of (item, rest)), weights and values strictly increasing
+        frontier = [(0, 0, None)]
+
+        for i in range(num_items):
+            _, weight, value = items[i]
+            shifted = [(w + weight, v + value, (i, taken)) for w, v, taken in frontier if w + weight <= capacity]
+
+            merged = []
+            a = b = 0
+            while a < len(frontier) or b < len(shifted):
+                # lighter state first; on equal weights the one without the item, unless the item is worth more
+                if b == len(shifted) or (a < len(frontier) and (frontier[a][0] < shifted[b][0] or
+                                                                 (frontier[a][0] == shifted[b][0] and frontier[a][1] >= shifted[b][1]))):
+                    state = frontier[a]
+                    a += 1
+                else:
+                    state = shifted[b]
+                    b += 1
+                # dominated unless it is worth more than every lighter state
+                if not merged or state[1] > merged[-1][1]:
+                    merged.append(state)
+            frontier = merged
+
+        # the heaviest state is the lightest one with the best value
+        selected_weight, max_value, taken = frontier[-1]
+        selected_items = []
+        while taken is not None:
+            i, taken = taken
+            selected_items.append(items[i][0])
+        selected_items.reverse()
+
+        return selected_items, selected_weight, max_value
+
+    def approxKnapsack(self, items: list, capacity: int, num_items: int, epsilon: float):
+        """
+        Approximate 0/1 Knapsack (fully polynomial time approximation scheme).  Values are divided by
+        K = epsilon * (largest value) / num_items and rounded down, then the lightest weight reaching each
+        scaled value is found by dynamic programming over at most num_items^2 / epsilon scaled values,
+        so the time does not depend on the capacity or the size of the values.
+        The value found is at least (1 - epsilon) times the optimum.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        @param epsilon: largest fraction of the optimal value that may be lost, between 0 and 1
+
+        @return (selected items, selected weight, value, bound), bound being the most the optimal value can be.
+        """
+        if epsilon <= 0 or epsilon >= 1:
+            raise Exception("Incorrect epsilon used.")
+
+        # items heavier than the knapsack can never be taken, and must not set the scale
+        fitting = [i for i in range(num_items) if items[i][1] <= capacity]
+        if len(fitting) == 0:
+            return [], 0, 0, 0
+
+        # values are left unscaled when they are already small enough
+        scale = max(1.0, epsilon * max(items[i][2] for i in fitting) / len(fitting))
+        scaled = [int(items[i][2] / scale) for i in fitting]
+        maxScaled = sum(scaled)
+
+        # lightest weight reaching exactly scaled value s with the items so far, capacity + 1 if none fits
+        # (so a subset is only recorded if it fits); bits of row k are set where the k-th fitting item is taken
+        row = array('q', [capacity + 1]) * (maxScaled + 1)
+        row[0] = 0
+        taken = [relaxRow(row, scaled[k], items[i][1], capacity) for k, i in enumerate(fitting)]
+
+        best = max(s for s in range(maxScaled + 1) if row[s] <= capacity)
+
+        selected_items, selected_weight, max_value = [], 0, 0
+        for k in walkBack(taken, scaled, best):
+            i = fitting[k]
+            selected_items.append(items[i][0])
+            selected_weight += items[i][1]
+            max_value += items[i][2]
+
+        if scale == 1.0:
+            # nothing was rounded, so the value is the optimum
+            return selected_items, selected_weight, max_value, max_value
+
+        # rounding loses less than scale per item, and the value found is at least (1 - epsilon) times the optimum;
+        # rounded up, so floating point error cannot make the bound too small
+        bound = min(math.ceil(scale * (best + len(fitting))), math.ceil(max_value / (1 - epsilon)))
+        return selected_items, selected_weight, max_value, max(bound, max_value)
+
+    def iterativeKnapsack(self, items: list, capacity: int, num_items: int, filename: str = None,
+                          stats: KnapsackStats = None):
+        """
+        The include/exclude recursion of the recursive 0/1 Knapsack, run on an explicit stack of frames
+        so any number of items fits within the interpreter's recursion limit.  Every pushed frame counts
+        as a call, in the order the recursion makes them, and the call count is logged when the base
+        case is first hit, as recursiveKnapsack does.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        @param filename: where to save call count on first base case (used for testing)
+        @param stats: counters for this run, a new one if None
+        """
+        if stats is None:
+            stats = KnapsackStats()
+
+        # frame stages
+        START, INCLUDED, EXCLUDED_ONLY, EXCLUDED = range(4)
+        # frames are [num_items, capacity, stage, value with the item, taken items with the item]
+        stack = [[num_items, capacity, START, 0, None]]
+        stats.calls = 1
+        stats.peakDepth = 1
+        # (value, taken items as a linked list of (item, rest)) returned by the last finished frame
+        result = (0, None)
+
+        while stack:
+            frame = stack[-1]
+            n, cap, stage = frame[0], frame[1], frame[2]
+
+            if stage == START:
+                # Base case
+                if cap == 0 or n == 0:
+                    if not stats.logged and filename:
+                        with open(filename + '.txt', "w") as f:
+                            f.write(str(stats.calls))
+                        stats.logged = True
+                    result = (0, None)
+                    stack.pop()
+                    continue
+
+                weight = items[n - 1][1]
+                if weight > cap:
+                    # item n cannot fit, only exclude it
+                    frame[2] = EXCLUDED_ONLY
+                    stack.append([n - 1, cap, START, 0, None])
+                else:
+                    frame[2] = INCLUDED
+                    stack.append([n - 1, cap - weight, START, 0, None])
+                stats.calls += 1
+                stats.peakDepth = max(stats.peakDepth, len(stack))
+
+            elif stage == INCLUDED:
+                frame[3] = result[0] + items[n - 1][2]
+                frame[4] = (n - 1, result[1])
+                frame[2] = EXCLUDED
+                stack.append([n - 1, cap, START, 0, None])
+                stats.calls += 1
+                stats.peakDepth = max(stats.peakDepth, len(stack))
+
+            elif stage == EXCLUDED_ONLY:
+                # the result of excluding the item passes straight up
+                stack.pop()
+
+            else:
+                if frame[3] > result[0]:
+                    result = (frame[3], frame[4])
+                stack.pop()
+
+        max_value, taken = result
+        selected_items, selected_weight = [], 0
+        while taken is not None:
+            i, taken = taken
+            selected_items.append(items[i][0])
+            selected_weight += items[i][1]
+        selected_items.reverse()
+
+        return selected_items, selected_weight, max_value
+
     def dynamicKnapsack(self, items: list, capacity: int, num_items: int, filename: str):
         """
         Dynamic 0/1 Knapsack that saves the dynamic programming table as a csv.
@@ -115,6 +648,77 @@ class Knapsack:
 
         return selected_items, selected_weight, max_value
 
+    def leanDynamicKnapsack(self, items: list, capacity: int, num_items: int, filename: str):
+        """
+        Dynamic 0/1 Knapsack over the same table as dynamicKnapsack (best value using exactly each weight),
+        keeping a single row of values and one bit per cell recording whether the item was taken,
+        as AllCapacitiesKnapsack does.
+        Uses about capacity * (8 + num_items / 8) bytes rather than a table of Python objects.
+        The table is only built and saved as a csv if saveTable is set.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        @param filename: save name for csv of table (used for testing)
+        """
+        solver = AllCapacitiesKnapsack([], capacity)
+        # first row is all 0s, as in dynamicKnapsack
+        dp = [[0] * (capacity + 1)] if self.saveTable else None
+
+        for i in range(num_items):
+            solver.addItem(items[i])
+            if dp is not None:
+                dp.append(solver.values())
+
+        if dp is not None:
+            self.saveCSV(dp, items, capacity, filename)
+
+        # lightest weight with the best value, then walk the items back from it
+        return solver.query(capacity)
+
+    def numpyDynamicKnapsack(self, items: list, capacity: int, num_items: int, filename: str):
+        """
+        Dynamic 0/1 Knapsack over the same table as dynamicKnapsack, computing each row in one vectorised
+        NumPy step, and saving the table as a csv.
+
+        @param items: list of (name, weight, value)
+        @param capacity: current remaining knapsack capacity
+        @param num_items: number of items still being considered
+        @param filename: save name for csv of table (used for testing)
+        """
+        if np is None:
+            raise Exception('NumPy is needed for the dynamic-numpy knapsack solver.')
+
+        # best value using exactly weight w of the first i items, -1 if no subset weighs w
+        dp = np.full((num_items + 1, capacity + 1), -1, dtype=np.int64)
+        dp[0, 0] = 0
+
+        for i in range(1, num_items + 1):
+            _, weight, value = items[i - 1]
+            prev = dp[i - 1]
+            dp[i] = prev
+            if weight <= capacity:
+                # taking item i on top of every reachable weight, unreachable weights stay unreachable
+                shifted = prev[:capacity + 1 - weight]
+                dp[i, weight:] = np.maximum(prev[weight:], np.where(shifted >= 0, shifted + value, -1))
+
+        # first row is all 0s, as in dynamicKnapsack
+        table = [[0] * (capacity + 1)] + [[(val if val >= 0 else None) for val in row] for row in dp[1:].tolist()]
+        self.saveCSV(table, items, capacity, filename)
+
+        # lightest weight with the best value, then walk the items back from it
+        max_value = int(dp[num_items].max())
+        selected_weight = int(np.argmax(dp[num_items]))
+        selected_items = []
+        w = selected_weight
+        for i in range(num_items, 0, -1):
+            if dp[i, w] != dp[i - 1, w]:
+                selected_items.append(items[i - 1][0])
+                w -= items[i - 1][1]
+        selected_items.reverse()
+
+        return selected_items, selected_weight, max_value
+
     def saveCSV(self, dp: list, items: list, capacity: int, filename: str):
         with open(filename+".csv", 'w', newline='') as f:
             writer = csv.writer(f)
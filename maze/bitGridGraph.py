@@ -0,0 +1,240 @@
+# ------------------------------------------------------------------------
+# Grid-indexed graph with bit-packed wall storage.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# ------------------------------------------------------------------------
+
+
+from array import array
+from collections.abc import Mapping
+from typing import Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maze.util import Coordinates
+from maze.gridGraph import GridGraph
+
+
+class BitGridCells(Mapping):
+    """
+    Read-only {(row, col): Coordinates} mapping over a flat array of cell weights.
+    Keys and their order are the same as the m_cells dict Maze.initCells builds, but
+    Coordinates are only created when looked up, so nothing per cell is held in memory
+    apart from its weight.  Weights must be set through setRowWeights, as setting them
+    on a looked up Coordinates is lost.  While every cell has the same weight, as in an
+    unweighted maze, the array is not allocated at all.
+    """
+
+    def __init__(self, rowNum: int, colNum: int, weights, uniformWeight: int = 1):
+        """
+        Constructor.
+
+        @param weights: rowNum * colNum cell weights, row after row, e.g., array('i') or a flat NumPy array,
+            or None if every cell weighs uniformWeight.
+        @param uniformWeight: weight of every cell while weights is None.
+        """
+        self.m_rowNum = rowNum
+        self.m_colNum = colNum
+        self.m_weights = weights
+        self.m_uniformWeight = uniformWeight
+
+    def __getitem__(self, key: Tuple[int, int]) -> Coordinates:
+        row, col = key
+        if 0 <= row < self.m_rowNum and 0 <= col < self.m_colNum:
+            coord = Coordinates(row, col)
+            if self.m_weights is None:
+                coord.m_weight = self.m_uniformWeight
+            else:
+                coord.m_weight = int(self.m_weights[row * self.m_colNum + col])
+            return coord
+        # boundary ring, without the corners
+        if (row in (-1, self.m_rowNum) and 0 <= col < self.m_colNum) or \
+                (col in (-1, self.m_colNum) and 0 <= row < self.m_rowNum):
+            return Coordinates(row, col)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for r in range(self.m_rowNum):
+            for c in range(self.m_colNum):
+                yield (r, c)
+        for c in range(self.m_colNum):
+            yield (-1, c)
+            yield (self.m_rowNum, c)
+        for r in range(self.m_rowNum):
+            yield (r, -1)
+            yield (r, self.m_colNum)
+
+    def __len__(self) -> int:
+        return self.m_rowNum * self.m_colNum + 2 * (self.m_rowNum + self.m_colNum)
+
+    def setRowWeights(self, row: int, weights: list, startCol: int = 0):
+        """
+        Overwrites the weights of a run of cells in a row, from column startCol on.
+        The weight array is allocated the first time a weight differs from the uniform weight.
+        """
+        if self.m_weights is None:
+            if all(weight == self.m_uniformWeight for weight in weights):
+                return
+            self.m_weights = array('i', [self.m_uniformWeight]) * (self.m_rowNum * self.m_colNum)
+        start = row * self.m_colNum + startCol
+        self.m_weights[start:start + len(weights)] = array('i', weights)
+
+
+class BitGridLabels:
+    """
+    Stands in for the label array of GridGraph, resolving label indices through a BitGridCells.
+    """
+
+    def __init__(self, cells: BitGridCells):
+        self.m_cells = cells
+        self.m_width = cells.m_colNum + 2
+
+    def __getitem__(self, idx: int) -> Optional[Coordinates]:
+        return self.m_cells.get((idx // self.m_width - 1, idx % self.m_width - 1))
+
+
+class BitGridGraph(GridGraph):
+    """
+    GridGraph that stores each wall as a single bit, where every cell of the grid and its
+    boundary ring is a vertex.
+
+    The two wall planes (including the walls to the boundary ring) are indexed exactly as in
+    GridGraph, but entry idx lives in bit (idx & 7) of byte (idx >> 3).  Vertices are not stored:
+    cells are resolved through BitGridCells from a 4 byte weight per cell, which is only allocated
+    once a cell weighs something other than 1.  An unweighted maze uses about 0.25 bytes per cell,
+    so a 10k x 10k one fits in roughly 25 MB; with weights it takes 4.25 bytes per cell, about 425 MB.
+    """
+
+    def __init__(self, rowNum: int, colNum: int, horiWalls=None, vertWalls=None, weights=None):
+        """
+        Constructor.  Unlike GridGraph, does not allocate a label array.
+
+        @param rowNum: number of rows in the maze.
+        @param colNum: number of columns in the maze.
+        @param horiWalls: writable buffer holding the packed horizontal wall plane, allocated if None.
+        @param vertWalls: writable buffer holding the packed vertical wall plane, allocated if None.
+        @param weights: flat writable buffer of the rowNum * colNum cell weights, allocated once a weight is set
+            if None.
+        """
+        self.m_rowNum = rowNum
+        self.m_colNum = colNum
+
+        self.m_vertWalls = vertWalls if vertWalls is not None else bytearray((rowNum * (colNum + 1) + 7) // 8)
+        self.m_horiWalls = horiWalls if horiWalls is not None else bytearray(((rowNum + 1) * colNum + 7) // 8)
+        # a buffer passed in is kept and written to, rather than dropped for unweighted mazes
+        self.m_ownsWeights = weights is None
+        self.m_cells = BitGridCells(rowNum, colNum, weights)
+        self.m_labels = BitGridLabels(self.m_cells)
+
+
+    def resetCells(self, addWallFlag: bool = True, wt: str = "unWeighted"):
+        """
+        Gives every cell the weight Maze.initCells would and sets or clears all walls, without creating the cells.
+
+        @param addWallFlag: Whether all walls are up.
+        @param wt: weight approach, as for Coordinates.
+        """
+        if wt == "unWeighted" and self.m_ownsWeights:
+            self.m_cells.m_weights = None
+            self.fillWalls(addWallFlag)
+            return
+
+        for r in range(self.m_rowNum):
+            if wt == "unWeighted":
+                rowWeights = array('i', [1]) * self.m_colNum
+            else:
+                # drawn cell by cell, so "random" weights use the same random numbers as Maze.initCells
+                rowWeights = array('i', [Coordinates(r, c, wt).getWeight() for c in range(self.m_colNum)])
+            self.m_cells.setRowWeights(r, rowWeights)
+
+        self.fillWalls(addWallFlag)
+
+
+    def fillWalls(self, wallStatus: bool):
+        for walls, count in ((self.m_horiWalls, (self.m_rowNum + 1) * self.m_colNum),
+                             (self.m_vertWalls, self.m_rowNum * (self.m_colNum + 1))):
+            walls[:] = bytes([0xFF if wallStatus else 0]) * len(walls)
+            # keep the padding bits of the last byte clear
+            if wallStatus and count % 8 != 0:
+                walls[len(walls) - 1] = (1 << (count % 8)) - 1
+
+
+    def bytesPerCell(self) -> float:
+        """
+        @returns Bytes used by the wall planes and cell weights per maze cell.
+        """
+        weights = self.m_cells.m_weights
+        weightBytes = 0 if weights is None else len(weights) * weights.itemsize
+        return (len(self.m_vertWalls) + len(self.m_horiWalls) + weightBytes) / max(1, self.m_rowNum * self.m_colNum)
+
+
+    def addVertex(self, label: Coordinates):
+        # all vertices already exist
+        pass
+
+    def addVerticesBulk(self, vertLabels):
+        pass
+
+
+    def addEdgesBulk(self, edges, addWall: bool = False):
+        # every vertex exists, so all the edges of the grid set every wall at once
+        if len(edges) == self.edgeCount():
+            self.fillWalls(addWall)
+        else:
+            for vert1, vert2 in edges:
+                self.addEdge(vert1, vert2, addWall)
+
+
+    def hasVertex(self, label: Coordinates) -> bool:
+        row = label.getRow()
+        col = label.getCol()
+        return -1 <= row <= self.m_rowNum and -1 <= col <= self.m_colNum and \
+            (0 <= row < self.m_rowNum or 0 <= col < self.m_colNum)
+
+
+    @property
+    def vertices(self):
+        return list(self.m_cells.values())
+
+
+    def readWall(self, walls: bytearray, idx: int) -> bool:
+        return (walls[idx >> 3] >> (idx & 7)) & 1 == 1
+
+    def writeWall(self, walls: bytearray, idx: int, wallStatus: bool):
+        if wallStatus:
+            walls[idx >> 3] |= 1 << (idx & 7)
+        else:
+            walls[idx >> 3] &= ~(1 << (idx & 7)) & 0xFF
+
+
+    def clearWalls(self, horiIdx, vertIdx):
+        for walls, idx in ((self.m_horiWalls, horiIdx), (self.m_vertWalls, vertIdx)):
+            masks = np.invert(np.left_shift(1, idx & 7).astype(np.uint8))
+            np.bitwise_and.at(np.frombuffer(walls, dtype=np.uint8), idx >> 3, masks)
+
+
+    def wallArrays(self) -> tuple:
+        """
+        Unpacks the wall bits into NumPy boolean matrices, laid out as in GridGraph.wallArrays.
+        The matrices are copies; writing to them does not update the graph.
+        """
+        horiWalls = np.unpackbits(np.frombuffer(self.m_horiWalls, dtype=np.uint8), count=(self.m_rowNum + 1) * self.m_colNum,
+                                  bitorder='little').astype(np.bool_).reshape(self.m_rowNum + 1, self.m_colNum)
+        vertWalls = np.unpackbits(np.frombuffer(self.m_vertWalls, dtype=np.uint8), count=self.m_rowNum * (self.m_colNum + 1),
+                                  bitorder='little').astype(np.bool_).reshape(self.m_rowNum, self.m_colNum + 1)
+        return horiWalls, vertWalls
+
+    def setWallArrays(self, horiWalls, vertWalls):
+        """
+        Packs the given NumPy matrices, laid out as in GridGraph.wallArrays, into the wall bits.
+        """
+        self.m_horiWalls = bytearray(np.packbits(np.asarray(horiWalls, dtype=np.bool_).reshape(-1), bitorder='little').tobytes())
+        self.m_vertWalls = bytearray(np.packbits(np.asarray(vertWalls, dtype=np.bool_).reshape(-1), bitorder='little').tobytes())
+
+    def setPackedWalls(self, horiBits, vertBits):
+        # already in our layout, so just copy the bytes
+        self.m_horiWalls = bytearray(horiBits)
+        self.m_vertWalls = bytearray(vertBits)
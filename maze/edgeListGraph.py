@@ -7,7 +7,7 @@
 # ------------------------------------------------------------------------
 
 
-from typing import List
+from typing import List, Tuple
 
 from maze.util import Coordinates
 from maze.graph import Graph
@@ -19,12 +19,15 @@ class EdgeListGraph(Graph):
     def __init__(self):
         self.vertices = []
         self.edges = []  # List of tuples (vert1, vert2, wallStatus)
+        # same labels as self.vertices, for O(1) membership tests
+        self.m_vertexSet = set()
         
 
   
     def addVertex(self, label:Coordinates):
-        if label not in self.vertices:
+        if label not in self.m_vertexSet:
             self.vertices.append(label)
+            self.m_vertexSet.add(label)
 
     def addVertices(self, vertLabels:List[Coordinates]):
         for label in vertLabels:
@@ -41,6 +44,12 @@ class EdgeListGraph(Graph):
         return False
       
 
+    def addEdgesBulk(self, edges:List[Tuple[Coordinates, Coordinates]], addWall:bool = False):
+        vertexSet = self.m_vertexSet
+        self.edges.extend([(vert1, vert2, addWall) for vert1, vert2 in edges
+                           if vert1 in vertexSet and vert2 in vertexSet and vert1 != vert2 and vert1.isAdjacent(vert2)])
+      
+
     def updateWall(self, vert1:Coordinates, vert2:Coordinates, wallStatus:bool)->bool:
         
         if self.hasVertex(vert1) and self.hasVertex(vert2):
@@ -67,7 +76,7 @@ class EdgeListGraph(Graph):
         
 
     def hasVertex(self, label:Coordinates)->bool:
-        return label in self.vertices
+        return label in self.m_vertexSet
 
 
 
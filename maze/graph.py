@@ -7,7 +7,7 @@
 # -------------------------------------------------
 
 
-from typing import List
+from typing import List, Tuple
 
 from maze.util import Coordinates
 
@@ -38,6 +38,18 @@ class Graph:
 
 
 
+    def addVerticesBulk(self, vertLabels:List[Coordinates]):
+        """
+        Adds a list of vertices to the graph in time linear in the length of the list.
+        Override if the implementation can do better than repeated addVertex calls.
+
+        @param vertLabels List of labels of the added vertices,
+        """
+        for label in vertLabels:
+            self.addVertex(label)
+
+
+
     def addEdge(self, vert1:Coordinates, vert2:Coordinates, addWall:bool = False)->bool:
         """
         Adds an edge to the graph.  An edge is defined by the two vertex labels, which are Coordinates.
@@ -52,6 +64,19 @@ class Graph:
 
 
 
+    def addEdgesBulk(self, edges:List[Tuple[Coordinates, Coordinates]], addWall:bool = False):
+        """
+        Adds a list of edges to the graph in time linear in the length of the list.
+        Override if the implementation can do better than repeated addEdge calls.
+
+        @param edges: List of (source vertex, target vertex) label pairs.
+        @param addWall: Whether to add walls as well.  Default is False.
+        """
+        for vert1, vert2 in edges:
+            self.addEdge(vert1, vert2, addWall)
+
+
+
     def updateWall(self, vert1:Coordinates, vert2:Coordinates, wallStatus:bool)->bool:
         """
         Sets edge weight/bool.  Edge must exist for the operation to succeed.
@@ -0,0 +1,315 @@
+# ------------------------------------------------------------------------
+# Grid-indexed graph implementation.
+# Vertices and walls are located by (row, col) arithmetic instead of
+# scanning vertex and edge lists, so every operation is O(1).
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# ------------------------------------------------------------------------
+
+
+import sys
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maze.util import Coordinates
+from maze.graph import Graph
+
+
+class GridGraph(Graph):
+    """
+    Graph over the cells of a rowNum x colNum maze plus its boundary ring.
+
+    Edges are the ones Maze.initCells creates: between horizontally adjacent cells
+    (r, c) and (r, c+1) for 0 <= r < rowNum, -1 <= c < colNum, and between vertically
+    adjacent cells (r, c) and (r+1, c) for -1 <= r < rowNum, 0 <= c < colNum.
+    An edge exists once both of its vertices have been added.
+
+    Wall status is stored in two indexed arrays, one entry per edge:
+    - m_vertWalls: walls between (r, c) and (r, c+1), at index r * (colNum+1) + c + 1.
+    - m_horiWalls: walls between (r, c) and (r+1, c), at index (r+1) * colNum + c.
+    """
+
+    def __init__(self, rowNum: int, colNum: int):
+        """
+        Constructor.
+
+        @param rowNum: number of rows in the maze.
+        @param colNum: number of columns in the maze.
+        """
+        self.m_rowNum = rowNum
+        self.m_colNum = colNum
+
+        self.vertices = []
+        # canonical vertex labels, indexed (r+1) * (colNum+2) + c + 1
+        self.m_labels: List[Optional[Coordinates]] = [None] * ((rowNum + 2) * (colNum + 2))
+
+        self.m_vertWalls = bytearray(rowNum * (colNum + 1))
+        self.m_horiWalls = bytearray((rowNum + 1) * colNum)
+
+
+    def labelIndex(self, row: int, col: int) -> int:
+        """
+        @returns Index of (row, col) into m_labels, or -1 if outside the grid and its boundary ring.
+        """
+        if -1 <= row <= self.m_rowNum and -1 <= col <= self.m_colNum:
+            return (row + 1) * (self.m_colNum + 2) + col + 1
+        return -1
+
+
+    def wallSlot(self, vert1: Coordinates, vert2: Coordinates) -> Optional[Tuple[bytearray, int]]:
+        """
+        Locates the wall entry of the edge between vert1 and vert2.
+
+        @returns (wall array, index) tuple, or None if the two cells do not share an edge of the grid.
+        """
+        r1 = vert1.getRow()
+        c1 = vert1.getCol()
+        r2 = vert2.getRow()
+        c2 = vert2.getCol()
+
+        if r1 == r2:
+            if c2 == c1 + 1:
+                col = c1
+            elif c1 == c2 + 1:
+                col = c2
+            else:
+                return None
+            if 0 <= r1 < self.m_rowNum and -1 <= col < self.m_colNum:
+                return self.m_vertWalls, r1 * (self.m_colNum + 1) + col + 1
+        elif c1 == c2:
+            if r2 == r1 + 1:
+                row = r1
+            elif r1 == r2 + 1:
+                row = r2
+            else:
+                return None
+            if -1 <= row < self.m_rowNum and 0 <= c1 < self.m_colNum:
+                return self.m_horiWalls, (row + 1) * self.m_colNum + c1
+
+        return None
+
+
+    def readWall(self, walls: bytearray, idx: int) -> bool:
+        """
+        @returns True if the wall entry at idx of walls is set.
+        """
+        return walls[idx] == 1
+
+    def writeWall(self, walls: bytearray, idx: int, wallStatus: bool):
+        """
+        Sets the wall entry at idx of walls.
+        """
+        walls[idx] = 1 if wallStatus else 0
+
+
+    def clearWalls(self, horiIdx, vertIdx):
+        """
+        Removes many walls at once.
+
+        @param horiIdx: NumPy int array of indices into m_horiWalls.
+        @param vertIdx: NumPy int array of indices into m_vertWalls.
+        """
+        np.frombuffer(self.m_horiWalls, dtype=np.uint8)[horiIdx] = 0
+        np.frombuffer(self.m_vertWalls, dtype=np.uint8)[vertIdx] = 0
+
+
+    def bytesPerCell(self) -> float:
+        """
+        @returns Bytes used by the wall arrays, label array and vertices per maze cell.
+        """
+        labelBytes = sys.getsizeof(self.m_labels) + sys.getsizeof(self.vertices) + \
+            sum(sys.getsizeof(label) for label in self.vertices[:1]) * len(self.vertices)
+        return (len(self.m_vertWalls) + len(self.m_horiWalls) + labelBytes) / max(1, self.m_rowNum * self.m_colNum)
+
+
+    def wallArrays(self) -> tuple:
+        """
+        Views the wall arrays as NumPy boolean matrices, without copying.
+        Writing to the matrices updates the walls of the graph.
+
+        @returns (horiWalls, vertWalls) with shapes (rowNum+1, colNum) and (rowNum, colNum+1);
+            horiWalls[r+1, c] is the wall between (r, c) and (r+1, c), vertWalls[r, c+1] the wall
+            between (r, c) and (r, c+1).
+        """
+        horiWalls = np.frombuffer(self.m_horiWalls, dtype=np.bool_).reshape(self.m_rowNum + 1, self.m_colNum)
+        vertWalls = np.frombuffer(self.m_vertWalls, dtype=np.bool_).reshape(self.m_rowNum, self.m_colNum + 1)
+        return horiWalls, vertWalls
+
+    def setWallArrays(self, horiWalls, vertWalls):
+        """
+        Replaces the walls with the given NumPy matrices, laid out as in wallArrays.
+        Contiguous, writable boolean matrices are adopted without copying, so later wall updates write into them;
+        read-only ones are copied.
+        """
+        horiWalls = np.ascontiguousarray(horiWalls, dtype=np.bool_).reshape(-1)
+        vertWalls = np.ascontiguousarray(vertWalls, dtype=np.bool_).reshape(-1)
+        if not horiWalls.flags.writeable:
+            horiWalls = horiWalls.copy()
+        if not vertWalls.flags.writeable:
+            vertWalls = vertWalls.copy()
+        self.m_horiWalls = memoryview(horiWalls).cast('B')
+        self.m_vertWalls = memoryview(vertWalls).cast('B')
+
+
+    def setPackedWalls(self, horiBits, vertBits):
+        """
+        Replaces the walls with packed bit planes, laid out as the wall storage of BitGridGraph.
+
+        @param horiBits: buffer holding bit (idx & 7) of byte (idx >> 3) for each index idx of m_horiWalls.
+        @param vertBits: same for m_vertWalls.
+        """
+        self.m_horiWalls = bytearray(np.unpackbits(np.frombuffer(horiBits, dtype=np.uint8), count=len(self.m_horiWalls),
+                                                   bitorder='little').tobytes())
+        self.m_vertWalls = bytearray(np.unpackbits(np.frombuffer(vertBits, dtype=np.uint8), count=len(self.m_vertWalls),
+                                                   bitorder='little').tobytes())
+
+
+    def edgeSlot(self, vert1: Coordinates, vert2: Coordinates) -> Optional[Tuple[bytearray, int]]:
+        """
+        Same as wallSlot, but only for edges whose two vertices have been added.
+        """
+        slot = self.wallSlot(vert1, vert2)
+        if slot is not None and self.hasVertex(vert1) and self.hasVertex(vert2):
+            return slot
+        return None
+
+
+    def addVertex(self, label: Coordinates):
+        idx = self.labelIndex(label.getRow(), label.getCol())
+        if idx >= 0 and self.m_labels[idx] is None:
+            self.m_labels[idx] = label
+            self.vertices.append(label)
+
+    def addVertices(self, vertLabels: List[Coordinates]):
+        for label in vertLabels:
+            self.addVertex(label)
+
+    def addVerticesBulk(self, vertLabels: List[Coordinates]):
+        # labelIndex inlined, as this runs once per cell when a maze is built
+        labels = self.m_labels
+        vertices = self.vertices
+        rowNum = self.m_rowNum
+        colNum = self.m_colNum
+        width = colNum + 2
+        for label in vertLabels:
+            row = label.m_r
+            col = label.m_c
+            if -1 <= row <= rowNum and -1 <= col <= colNum:
+                idx = (row + 1) * width + col + 1
+                if labels[idx] is None:
+                    labels[idx] = label
+                    vertices.append(label)
+
+
+    def edgeCount(self) -> int:
+        """
+        @returns Number of edges of the grid, one per wall entry.
+        """
+        return self.m_rowNum * (self.m_colNum + 1) + (self.m_rowNum + 1) * self.m_colNum
+
+    def fillWalls(self, wallStatus: bool):
+        """
+        Sets or clears every wall.
+        """
+        value = 1 if wallStatus else 0
+        self.m_vertWalls[:] = bytes([value]) * len(self.m_vertWalls)
+        self.m_horiWalls[:] = bytes([value]) * len(self.m_horiWalls)
+
+
+    def addEdge(self, vert1: Coordinates, vert2: Coordinates, addWall: bool = False) -> bool:
+        # the edge itself is implied by the grid, so adding it just sets its wall
+        return self.updateWall(vert1, vert2, addWall)
+
+
+    def addEdgesBulk(self, edges: List[Tuple[Coordinates, Coordinates]], addWall: bool = False):
+        # every edge of the grid, each listed once between added vertices as Maze.initCells passes them,
+        # sets every wall at once
+        if len(edges) == self.edgeCount() and len(self.vertices) == self.m_rowNum * self.m_colNum + \
+                2 * (self.m_rowNum + self.m_colNum):
+            self.fillWalls(addWall)
+        else:
+            super().addEdgesBulk(edges, addWall)
+
+
+    def updateWall(self, vert1: Coordinates, vert2: Coordinates, wallStatus: bool) -> bool:
+        slot = self.edgeSlot(vert1, vert2)
+        if slot is not None:
+            walls, idx = slot
+            self.writeWall(walls, idx, wallStatus)
+            return True
+        return False
+
+
+    def removeEdge(self, vert1: Coordinates, vert2: Coordinates) -> bool:
+        # edges are fixed by the shape of the grid and cannot be removed
+        return False
+
+
+    def hasVertex(self, label: Coordinates) -> bool:
+        idx = self.labelIndex(label.getRow(), label.getCol())
+        return idx >= 0 and self.m_labels[idx] is not None
+
+
+    def hasEdge(self, vert1: Coordinates, vert2: Coordinates) -> bool:
+        return self.edgeSlot(vert1, vert2) is not None
+
+
+    def getWallStatus(self, vert1: Coordinates, vert2: Coordinates) -> bool:
+        slot = self.edgeSlot(vert1, vert2)
+        if slot is not None:
+            walls, idx = slot
+            return self.readWall(walls, idx)
+        return False
+
+
+    def neighbours(self, label: Coordinates) -> List[Coordinates]:
+        row = label.getRow()
+        col = label.getCol()
+        idx = self.labelIndex(row, col)
+        if idx < 0 or self.m_labels[idx] is None:
+            return []
+
+        labels = self.m_labels
+        width = self.m_colNum + 2
+        neighbors = []
+        # same order as EdgeListGraph (left, right, up, down), so seeded generation is unchanged
+        if 0 <= row < self.m_rowNum:
+            if col > -1:
+                neighbors.append(labels[idx - 1])
+            if col < self.m_colNum:
+                neighbors.append(labels[idx + 1])
+        if 0 <= col < self.m_colNum:
+            if row > -1:
+                neighbors.append(labels[idx - width])
+            if row < self.m_rowNum:
+                neighbors.append(labels[idx + width])
+
+        return [neigh for neigh in neighbors if neigh is not None]
+
+
+    @property
+    def edges(self) -> List[tuple]:
+        """
+        Edges as (vert1, vert2, wallStatus) tuples, in the order Maze.initCells adds them.
+        Built on demand; prefer hasEdge/getWallStatus for lookups.
+        """
+        edges = []
+        for row in range(0, self.m_rowNum):
+            for col in range(-1, self.m_colNum):
+                cell1 = self.m_labels[self.labelIndex(row, col)]
+                cell2 = self.m_labels[self.labelIndex(row, col + 1)]
+                if cell1 is not None and cell2 is not None:
+                    edges.append((cell1, cell2, self.readWall(self.m_vertWalls, row * (self.m_colNum + 1) + col + 1)))
+
+        for col in range(0, self.m_colNum):
+            for row in range(-1, self.m_rowNum):
+                cell1 = self.m_labels[self.labelIndex(row, col)]
+                cell2 = self.m_labels[self.labelIndex(row + 1, col)]
+                if cell1 is not None and cell2 is not None:
+                    edges.append((cell1, cell2, self.readWall(self.m_horiWalls, (row + 1) * self.m_colNum + col)))
+
+        return edges
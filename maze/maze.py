@@ -8,10 +8,19 @@
 
 from typing import List
 import random
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 from maze.util import Coordinates
+from maze.graph import Graph
 from maze.edgeListGraph import EdgeListGraph
+from maze.gridGraph import GridGraph
+from maze.bitGridGraph import BitGridGraph
 
 
 class Maze:
@@ -20,12 +29,13 @@ class Maze:
     """
 
 
-    def __init__(self, rowNum:int, colNum:int, itemParams:list):
+    def __init__(self, rowNum:int, colNum:int, itemParams:list, graphType:str = "edgeList"):
         """
         Constructor.
 
         @param rowNum: number of rows in the maze.
         @param colNum: number of columns in the maze
+        @param graphType: graph implementation storing the cells and walls ("edgeList", "grid" or "bitGrid")
         """
         self.m_rowNum = rowNum
         self.m_colNum = colNum
@@ -33,7 +43,7 @@ class Maze:
         # entrances and exits
         self.m_entrance = list()
         self.m_exit = list()
-        self.m_graph = EdgeListGraph() 
+        self.m_graph = self.initGraph(graphType)
 
         # Store coordinates for reuse
         self.m_cells = {}
@@ -46,6 +56,24 @@ class Maze:
 
 
 
+    def initGraph(self, graphType:str)->Graph:
+        """
+        Creates the graph that stores the cells and walls of the maze.
+        Override to customise behaviour.
+
+        @param graphType: graph implementation to use ("edgeList", "grid" or "bitGrid").
+        """
+        if graphType == "edgeList":
+            return EdgeListGraph()
+        elif graphType == "grid":
+            return GridGraph(self.m_rowNum, self.m_colNum)
+        elif graphType == "bitGrid":
+            return BitGridGraph(self.m_rowNum, self.m_colNum)
+        else:
+            raise Exception("Incorrect graph type used.")
+
+
+
     def initCells(self,  addWallFlag:bool = True, wt: str = "unWeighted" ):
         """
         Initialises the cells in the maze. 
@@ -53,15 +81,20 @@ class Maze:
 
         @param addWallFlag: Whether we should also add the walls between cells.  Default is True.
         """
-        
+        if isinstance(self.m_graph, BitGridGraph):
+            # cells are resolved from the weights the graph stores when looked up, rather than held as Coordinates
+            self.m_cells = self.m_graph.m_cells
+            self.m_graph.resetCells(addWallFlag, wt)
+            return
 
-        # add the vertices and edges to the graph
+        # add the vertices and edges to the graph in bulk, so construction is linear in the number of cells
         # Add vertices and initialize Coordinates with weights
+        vertices = []
         for r in range(self.m_rowNum):
             for c in range(self.m_colNum):
                 coord = Coordinates(r, c, wt)
                 self.m_cells[(r, c)] = coord  
-                self.m_graph.addVertex(coord)
+                vertices.append(coord)
 
 
         # add boundary vertices and store them in cells; the weights are assigned to 0
@@ -72,7 +105,7 @@ class Maze:
             bottom_boundary = Coordinates(self.m_rowNum, c)  
             self.m_cells[(-1, c)] = top_boundary
             self.m_cells[(self.m_rowNum, c)] = bottom_boundary
-            self.m_graph.addVertices([top_boundary, bottom_boundary])
+            vertices.extend([top_boundary, bottom_boundary])
 
         for r in range(self.m_rowNum):
             # Left and right boundaries (col -1 and col m_colNum)
@@ -80,15 +113,23 @@ class Maze:
             right_boundary = Coordinates(r, self.m_colNum)  
             self.m_cells[(r, -1)] = left_boundary
             self.m_cells[(r, self.m_colNum)] = right_boundary
-            self.m_graph.addVertices([left_boundary, right_boundary])
+            vertices.extend([left_boundary, right_boundary])
+
+        self.m_graph.addVerticesBulk(vertices)
+
+        if isinstance(self.m_graph, GridGraph):
+            # the grid implies every edge once its vertices are added, so only the walls are set
+            self.m_graph.fillWalls(addWallFlag)
+            return
 
         # add adjacenies/edges to the graph
         # Add adjacencies/edges to the graph using the stored cells
+        edges = []
         for row in range(0, self.m_rowNum):
             for col in range(-1, self.m_colNum):
                 cell1 = self.m_cells[(row, col)]
                 cell2 = self.m_cells[(row, col + 1)]
-                self.m_graph.addEdge(cell1, cell2, addWallFlag)
+                edges.append((cell1, cell2))
         
         # Scan columns now
         for col in range(0, self.m_colNum):
@@ -96,7 +137,9 @@ class Maze:
                 # Use pre-initialized cells with weights
                 cell1 = self.m_cells[(row, col)]
                 cell2 = self.m_cells[(row + 1, col)]
-                self.m_graph.addEdge(cell1, cell2, addWallFlag)
+                edges.append((cell1, cell2))
+
+        self.m_graph.addEdgesBulk(edges, addWallFlag)
         
 
     def initItems(self):
@@ -107,6 +150,10 @@ class Maze:
         max_weight = self.m_itemParams[1]
         max_value = self.m_itemParams[2]
 
+        if isinstance(self.m_graph, BitGridGraph):
+            self.initItemsIndexed(num_items, max_weight, max_value)
+            return
+
         # generate a list of possible cells. Remove from this list when we choose this cell.
         remaining_cells = [(i, j) for i in range(0, self.m_rowNum) for j in range(0, self.m_colNum)]
 
@@ -121,6 +168,30 @@ class Maze:
 
             self.m_items[loc] = [weight, value]
 
+    def initItemsIndexed(self, num_items:int, max_weight:int, max_value:int):
+        """
+        Adds items as initItems does, drawing the same random numbers, without materialising the list of all cells.
+        """
+        num_cells = self.m_rowNum * self.m_colNum
+
+        # sorted flat indices of the cells already chosen, i.e., removed from the remaining cells
+        chosen = []
+        for i in range(num_items):
+            if i >= num_cells:
+                raise Exception('Number of items exceeds cells')
+
+            weight = random.randint(1, max_weight)
+            value = random.randint(1, max_value)
+            # index into the remaining cells, then skip over the chosen cells before it
+            idx = random.choice(range(num_cells - i))
+            for taken in chosen:
+                if taken <= idx:
+                    idx += 1
+            chosen.append(idx)
+            chosen.sort()
+
+            self.m_items[(idx // self.m_colNum, idx % self.m_colNum)] = [weight, value]
+
 
 
 
@@ -207,6 +278,145 @@ class Maze:
         """
         return self.m_graph.getWallStatus(cell1, cell2)
     
+    def toArrays(self)->tuple:
+        """
+        Exports the walls and cell weights as NumPy arrays, for vectorised analysis.
+        For the "grid" graph type the wall arrays, and for the "bitGrid" graph type the weights, are views of the
+        maze storage, not copies.
+
+        @returns (horiWalls, vertWalls, weights): horiWalls is a (rowNum+1) x colNum boolean array where
+            horiWalls[r+1, c] is the wall between (r, c) and (r+1, c); vertWalls is a rowNum x (colNum+1)
+            boolean array where vertWalls[r, c+1] is the wall between (r, c) and (r, c+1); weights is a
+            rowNum x colNum int array of cell weights.  Boundary walls are the first/last row or column.
+        """
+        horiWalls, vertWalls = self.wallArrays()
+        if isinstance(self.m_graph, BitGridGraph):
+            cells = self.m_graph.m_cells
+            if cells.m_weights is None:
+                # unweighted, so a read-only view of the one weight every cell has
+                weights = np.broadcast_to(np.int32(cells.m_uniformWeight), (self.m_rowNum, self.m_colNum))
+            else:
+                weights = np.frombuffer(cells.m_weights, dtype=np.int32).reshape(self.m_rowNum, self.m_colNum)
+            return horiWalls, vertWalls, weights
+
+        weights = np.fromiter((self.m_cells[(r, c)].getWeight() for r in range(self.m_rowNum) for c in range(self.m_colNum)),
+                              dtype=np.int64, count=self.m_rowNum * self.m_colNum).reshape(self.m_rowNum, self.m_colNum)
+
+        return horiWalls, vertWalls, weights
+
+    def wallArrays(self)->tuple:
+        """
+        Exports only the walls, as the first two arrays returned by toArrays.
+        """
+        if np is None:
+            raise Exception('NumPy is needed to export a maze to arrays.')
+
+        if isinstance(self.m_graph, GridGraph):
+            horiWalls, vertWalls = self.m_graph.wallArrays()
+        else:
+            horiWalls = np.zeros((self.m_rowNum + 1, self.m_colNum), dtype=np.bool_)
+            vertWalls = np.zeros((self.m_rowNum, self.m_colNum + 1), dtype=np.bool_)
+            for cell1, cell2, wall in self.m_graph.edges:
+                row = min(cell1.getRow(), cell2.getRow())
+                col = min(cell1.getCol(), cell2.getCol())
+                if cell1.getRow() == cell2.getRow():
+                    vertWalls[row, col + 1] = wall
+                else:
+                    horiWalls[row + 1, col] = wall
+
+        return horiWalls, vertWalls
+
+    @classmethod
+    def fromArrays(cls, horiWalls, vertWalls, weights, itemParams:list, graphType:str = "grid")->'Maze':
+        """
+        Builds a maze from arrays laid out as returned by toArrays.
+        For the "grid" graph type, contiguous, writable boolean wall arrays are adopted without copying.
+
+        @param horiWalls: (rowNum+1) x colNum boolean array of walls between vertically adjacent cells.
+        @param vertWalls: rowNum x (colNum+1) boolean array of walls between horizontally adjacent cells.
+        @param weights: rowNum x colNum int array of cell weights.
+        @param itemParams: item parameters, as for the constructor.
+        @param graphType: graph implementation backing the maze.
+        @return: The new maze.
+        """
+        if np is None:
+            raise Exception('NumPy is needed to build a maze from arrays.')
+
+        rowNum, colNum = np.shape(weights)
+        if np.shape(horiWalls) != (rowNum + 1, colNum) or np.shape(vertWalls) != (rowNum, colNum + 1):
+            raise Exception('Wall arrays do not match the shape of the weights.')
+
+        maze = cls(rowNum, colNum, itemParams, graphType)
+        maze.setArrays(horiWalls, vertWalls, weights)
+
+        return maze
+
+    def setArrays(self, horiWalls, vertWalls, weights):
+        """
+        Overwrites the walls and cell weights with arrays laid out as returned by toArrays.
+        For the "grid" graph type, contiguous, writable boolean wall arrays are adopted without copying.
+        """
+        if np is None:
+            raise Exception('NumPy is needed to load a maze from arrays.')
+
+        if np.shape(weights) != (self.m_rowNum, self.m_colNum) or np.shape(horiWalls) != (self.m_rowNum + 1, self.m_colNum) \
+                or np.shape(vertWalls) != (self.m_rowNum, self.m_colNum + 1):
+            raise Exception('Arrays do not match the shape of the maze.')
+
+        self.setWeights(weights)
+
+        if isinstance(self.m_graph, GridGraph):
+            self.m_graph.setWallArrays(horiWalls, vertWalls)
+        else:
+            # rebuild the edge list in one pass, as updateWall would scan it for every wall
+            horiRows = np.asarray(horiWalls, dtype=np.bool_).tolist()
+            vertRows = np.asarray(vertWalls, dtype=np.bool_).tolist()
+            edges = []
+            for cell1, cell2, _ in self.m_graph.edges:
+                # upper or left cell first, as updateWall would store it
+                if (cell2.getRow(), cell2.getCol()) < (cell1.getRow(), cell1.getCol()):
+                    cell1, cell2 = cell2, cell1
+                if cell1.getRow() == cell2.getRow():
+                    edges.append((cell1, cell2, vertRows[cell1.getRow()][cell2.getCol()]))
+                else:
+                    edges.append((cell1, cell2, horiRows[cell2.getRow()][cell1.getCol()]))
+            self.m_graph.edges = edges
+
+    def setWeights(self, weights):
+        """
+        Overwrites the cell weights with a rowNum x colNum array.
+        """
+        for r, rowWeights in enumerate(np.asarray(weights).tolist()):
+            self.setRowWeights(r, rowWeights)
+
+    def setRowWeights(self, row:int, weights:list, startCol:int = 0):
+        """
+        Overwrites the weights of a run of cells in a row, from column startCol on.
+        Weights are always set through here, so mazes that store them outside the cells can override it.
+        """
+        if isinstance(self.m_graph, BitGridGraph):
+            self.m_graph.m_cells.setRowWeights(row, weights, startCol)
+            return
+        if isinstance(self.m_graph, GridGraph):
+            # a row of cells is a contiguous run of labels
+            start = self.m_graph.labelIndex(row, startCol)
+            rowCells = self.m_graph.m_labels[start:start + len(weights)]
+        else:
+            rowCells = [self.m_cells[(row, c)] for c in range(startCol, startCol + len(weights))]
+        for cell, weight in zip(rowCells, weights):
+            cell.m_weight = weight
+
+    def bytesPerCell(self)->float:
+        """
+        Estimates the memory held per cell by the graph and, unless cells are resolved lazily, the dict of cells.
+        Only graphs that report their own size support this ("grid" and "bitGrid").
+        """
+        cellBytes = 0
+        if isinstance(self.m_cells, dict) and len(self.m_cells) > 0:
+            # the dict itself, plus a (row, col) key tuple per cell
+            cellBytes = sys.getsizeof(self.m_cells) + sys.getsizeof(next(iter(self.m_cells))) * len(self.m_cells)
+        return self.m_graph.bytesPerCell() + cellBytes / max(1, self.m_rowNum * self.m_colNum)
+
     def hasEdge(self, cell1:Coordinates, cell2:Coordinates)->bool:
         """
         Checks if there is an edge between cell1 and cell2.
@@ -255,6 +465,20 @@ class Maze:
         """
         return self.m_graph.edges  
     
+    def getCell(self, row:int, col:int)->Coordinates:
+        """
+        Retrieves the canonical Coordinates of a cell, so callers share one instance per cell
+        instead of allocating new ones for every lookup.
+
+        @param row: Row of the cell.
+        @param col: Column of the cell.
+        @return: The Coordinates stored in the maze, or a new one if (row, col) is not a maze cell.
+        """
+        cell = self.m_cells.get((row, col))
+        if cell is None:
+            cell = Coordinates(row, col)
+        return cell
+
     def getCoords(self)->List[Coordinates]:
         """
         Retrieves all coordinates (including their weight) from the maze.
@@ -38,7 +38,6 @@ except:
     
 
 from maze.maze import Maze
-from maze.util import Coordinates
 
 from solver.mazeSolver import MazeSolver
 
@@ -183,11 +182,11 @@ class Visualizer(object):
         for r in range(0, self.m_maze.rowNum()):
             for c in range(0, self.m_maze.colNum()):
                 # top
-                if self.m_maze.hasWall(Coordinates(r-1,c), Coordinates(r,c)):
+                if self.m_maze.hasWall(self.m_maze.getCell(r-1,c), self.m_maze.getCell(r,c)):
                     self.m_ax.plot([(c+1)*self.m_cellSize, (c+1+1)*self.m_cellSize],
                                    [(r+1)*self.m_cellSize, (r+1)*self.m_cellSize], color="k")    
                 # left
-                if self.m_maze.hasWall(Coordinates(r,c-1), Coordinates(r,c)):
+                if self.m_maze.hasWall(self.m_maze.getCell(r,c-1), self.m_maze.getCell(r,c)):
                     self.m_ax.plot([(c+1)*self.m_cellSize, (c+1)*self.m_cellSize],
                                    [(r+1)*self.m_cellSize, (r+1+1)*self.m_cellSize], color="k")  
 
@@ -195,14 +194,14 @@ class Visualizer(object):
         # do bottom boundary 
         for c in range(0, self.m_maze.colNum()):
             # top
-            if self.m_maze.hasWall(Coordinates(self.m_maze.rowNum()-1,c), Coordinates(self.m_maze.rowNum(),c)):
+            if self.m_maze.hasWall(self.m_maze.getCell(self.m_maze.rowNum()-1,c), self.m_maze.getCell(self.m_maze.rowNum(),c)):
                 self.m_ax.plot([(c+1)*self.m_cellSize, (c+1+1)*self.m_cellSize],
                                 [(self.m_maze.rowNum()+1)*self.m_cellSize, (self.m_maze.rowNum()+1)*self.m_cellSize], color="k")    
 
         # do right boundary 
         for r in range(0, self.m_maze.rowNum()):
             # left
-            if self.m_maze.hasWall(Coordinates(r,self.m_maze.colNum()-1), Coordinates(r,self.m_maze.colNum())):
+            if self.m_maze.hasWall(self.m_maze.getCell(r,self.m_maze.colNum()-1), self.m_maze.getCell(r,self.m_maze.colNum())):
                 self.m_ax.plot([(self.m_maze.colNum()+1)*self.m_cellSize, (self.m_maze.colNum()+1)*self.m_cellSize],
                                 [(r+1)*self.m_cellSize, (r+1+1)*self.m_cellSize], color="k")  
 
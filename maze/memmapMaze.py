@@ -0,0 +1,148 @@
+# -------------------------------------------------
+# Maze whose walls and cell weights live in memory-mapped files.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------
+
+import json
+import os
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maze.graph import Graph
+from maze.bitGridGraph import BitGridGraph
+from maze.maze import Maze
+
+
+class MemmapGridGraph(BitGridGraph):
+    """
+    BitGridGraph over externally owned wall bit planes and cell weights, which it updates in place.
+    """
+
+    def setWallArrays(self, horiWalls, vertWalls):
+        # write into the mapped planes rather than replacing them
+        self.m_horiWalls[:] = np.packbits(np.asarray(horiWalls, dtype=np.bool_).reshape(-1), bitorder='little').tobytes()
+        self.m_vertWalls[:] = np.packbits(np.asarray(vertWalls, dtype=np.bool_).reshape(-1), bitorder='little').tobytes()
+
+    def setPackedWalls(self, horiBits, vertBits):
+        self.m_horiWalls[:] = horiBits
+        self.m_vertWalls[:] = vertBits
+
+
+class MemmapMaze(Maze):
+    """
+    Maze stored in a directory of memory-mapped files, so it can be far larger than RAM:
+    - meta.json: dimensions, item and generation parameters, and items.
+    - horiWalls.dat, vertWalls.dat: wall bit planes, laid out as in BitGridGraph.
+    - weights.dat: rowNum x colNum int32 cell weights.
+
+    If the directory already holds a maze it is reopened without regenerating anything,
+    otherwise a new maze with all walls up is created there.
+    """
+
+    META_FILE = 'meta.json'
+    HORI_WALLS_FILE = 'horiWalls.dat'
+    VERT_WALLS_FILE = 'vertWalls.dat'
+    WEIGHTS_FILE = 'weights.dat'
+
+
+    def __init__(self, path: str, rowNum: int, colNum: int, itemParams: list, genParams: dict = None):
+        """
+        Constructor.
+
+        @param path: directory of the maze files.
+        @param rowNum: number of rows in the maze.
+        @param colNum: number of columns in the maze.
+        @param itemParams: item parameters, used if the maze is created.
+        @param genParams: JSON serialisable parameters the maze is generated or read with (e.g., seed and generator);
+            a stored maze is only reopened if they, the dimensions and the item parameters match.
+        """
+        if np is None:
+            raise Exception('NumPy is needed for memory-mapped mazes.')
+
+        self.m_path = path
+        self.m_meta = None
+        metaFname = os.path.join(path, self.META_FILE)
+        if os.path.exists(metaFname):
+            with open(metaFname, 'r') as metaFile:
+                self.m_meta = json.load(metaFile)
+            if self.m_meta['rowNum'] != rowNum or self.m_meta['colNum'] != colNum:
+                raise Exception('Stored maze has different dimensions.')
+            if self.m_meta['itemParams'] != list(itemParams) or self.m_meta.get('genParams') != genParams:
+                raise Exception('Stored maze was generated with different parameters.')
+        self.m_genParams = genParams
+
+        super().__init__(rowNum, colNum, itemParams, "bitGrid")
+
+
+    def isReopened(self) -> bool:
+        """
+        @returns True if the maze was loaded from existing files rather than created.
+        """
+        return self.m_meta is not None
+
+
+    def mapFile(self, fname: str, dtype, shape):
+        """
+        Memory maps one of the maze files, creating it if the maze is new.
+        """
+        mode = 'r+' if self.isReopened() else 'w+'
+        return np.memmap(os.path.join(self.m_path, fname), dtype=dtype, mode=mode, shape=shape)
+
+
+    def initGraph(self, graphType: str) -> Graph:
+        os.makedirs(self.m_path, exist_ok=True)
+
+        self.m_horiMap = self.mapFile(self.HORI_WALLS_FILE, np.uint8, ((self.m_rowNum + 1) * self.m_colNum + 7) // 8)
+        self.m_vertMap = self.mapFile(self.VERT_WALLS_FILE, np.uint8, (self.m_rowNum * (self.m_colNum + 1) + 7) // 8)
+        self.m_weights = self.mapFile(self.WEIGHTS_FILE, np.int32, (self.m_rowNum, self.m_colNum))
+
+        return MemmapGridGraph(self.m_rowNum, self.m_colNum, memoryview(self.m_horiMap), memoryview(self.m_vertMap),
+                               self.m_weights.reshape(-1))
+
+
+    def initCells(self, addWallFlag: bool = True, wt: str = "unWeighted"):
+        # Maze.__init__ resets m_cells before calling this
+        self.m_cells = self.m_graph.m_cells
+        if self.isReopened():
+            return
+        self.m_graph.resetCells(addWallFlag, wt)
+
+
+    def initItems(self):
+        if self.isReopened():
+            self.m_items = {(r, c): [weight, value] for r, c, weight, value in self.m_meta['items']}
+            return
+        super().initItems()
+
+
+    def setWeights(self, weights):
+        self.m_weights[:] = weights
+
+
+    def toArrays(self) -> tuple:
+        horiWalls, vertWalls = self.m_graph.wallArrays()
+        return horiWalls, vertWalls, self.m_weights
+
+
+    def flush(self):
+        """
+        Writes the walls, weights and items of the maze to its files.
+        Until this is called for a new maze, the directory is not reopened as a stored maze.
+        """
+        self.m_horiMap.flush()
+        self.m_vertMap.flush()
+        self.m_weights.flush()
+
+        meta = {
+            'rowNum': self.m_rowNum,
+            'colNum': self.m_colNum,
+            'itemParams': self.m_itemParams,
+            'genParams': self.m_genParams,
+            'items': [[r, c, weight, value] for (r, c), (weight, value) in self.m_items.items()]
+        }
+        with open(os.path.join(self.m_path, self.META_FILE), 'w') as metaFile:
+            json.dump(meta, metaFile)
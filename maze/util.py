@@ -24,6 +24,9 @@ class Coordinates:
     Represent coordinates for maze cells.
     """
 
+    # no per-instance __dict__; mazes hold one of these per cell
+    __slots__ = ('m_r', 'm_c', 'm_weight')
+
     def __init__(self, row:int, col:int, weight:str = None):
         """
         Constructor.
@@ -103,8 +106,8 @@ class Coordinates:
 
         @param other: Other coordinates that we are comparing with.
         """
-        if other != None:
-            return self.m_r == other.getRow() and self.m_c == other.getCol()
+        if isinstance(other, Coordinates):
+            return self.m_r == other.m_r and self.m_c == other.m_c
         else:
             return False
 
@@ -114,7 +117,7 @@ class Coordinates:
         """
         Returns hash value of Coordinates.  Needed for being a key in dictionaries.
         """
-        return hash(str(self.m_r)+'|'+str(self.m_c))
+        return hash((self.m_r, self.m_c))
     
     
     
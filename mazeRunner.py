@@ -16,11 +16,13 @@ from typing import List
 
 from maze.util import Coordinates
 from maze.maze import Maze
+from maze.memmapMaze import MemmapMaze
 
 from knapsack.knapsack import Knapsack
 
 from reader.mazeReader import MazeReader
 from generator.mazeGenerator import MazeGenerator
+from generator.mazeCache import MazeCache
 from solver.mazeSolver import MazeSolver
 
 # this checks if Visualizer has been imported properly.
@@ -51,6 +53,10 @@ def findItemsAndCalculatePath(knapsack: Knapsack, solver: MazeSolver, maze: Maze
 	pick up the items, and leave the maze.
 	"""
     knapsack.solveKnapsack(maze, csvFilename)
+    if knapsack.stats is not None:
+        print(f'Knapsack solver made {knapsack.stats}')
+    if knapsack.optimalBound is not None:
+        print(f'Knapsack value {knapsack.optimalValue}, optimal value at most {knapsack.optimalBound}')
     solver.solveMaze(maze, entrance, exit)
 
 
@@ -82,6 +88,18 @@ if __name__ == '__main__':
 
         if randWall > 80 or randWall < 0:
             raise Exception('We cannot remove this percentage of walls.')
+        # Optional: maze generator to use, "recurBack" (default), "eller" or "tiled"
+        generatorName: str = "recurBack"
+        if 'generator' in configDict.keys():
+            generatorName = configDict['generator']
+        # Optional: number of worker processes for the "tiled" generator, defaults to the number of cores
+        workers: int = None
+        if 'workers' in configDict.keys():
+            workers = configDict['workers']
+        # Optional: how random walls are removed after carving, "exact" (default) or "batched"
+        wallRemoval: str = "exact"
+        if 'wallRemoval' in configDict.keys():
+            wallRemoval = configDict['wallRemoval']
 
         # solver approach to use
         pathFinderApproach: str = configDict['pathFinder']
@@ -97,6 +115,10 @@ if __name__ == '__main__':
             usage()
 
         fileMaze: bool = configDict['mazeFromFile']
+        # Optional: how a text maze file is parsed, "stream" (default, line by line) or "numpy" (whole file at once, vectorised)
+        mazeParser: str = "stream"
+        if 'mazeParser' in configDict.keys():
+            mazeParser = configDict['mazeParser']
 
         # whether to visualise the generated maze and solving solution or not
         bVisualise: bool = configDict['visualise']
@@ -122,12 +144,61 @@ if __name__ == '__main__':
         # initialise knapsack config
         capacity = configDict['knapsackCapacity']
         knapsackSolver = configDict['knapsackSolver']
+        # Optional: maximum number of subproblems the "recur-memo" solver caches
+        knapsackCacheSize: int = 2**20
+        if 'knapsackCacheSize' in configDict.keys():
+            knapsackCacheSize = configDict['knapsackCacheSize']
+        # Optional: whether solvers that do not need it (e.g., "dynamic-lean") still save the full table to <fileOutput>.csv
+        knapsackTable: bool = False
+        if 'knapsackTable' in configDict.keys():
+            knapsackTable = configDict['knapsackTable']
+        # Optional: capacities to sweep, all answered from one solve at the largest and saved to <fileOutput>_sweep.csv
+        knapsackSweep: List[int] = None
+        if 'knapsackSweep' in configDict.keys():
+            knapsackSweep = configDict['knapsackSweep']
+        # Optional: largest fraction of the optimal value the "approx" solver may lose
+        epsilon: float = 0.1
+        if 'epsilon' in configDict.keys():
+            epsilon = configDict['epsilon']
+
+        # Optional: graph implementation backing the maze (defaults to the edge list)
+        graphType: str = "edgeList"
+        if 'graphType' in configDict.keys():
+            graphType = configDict['graphType']
+
+        # Optional: directory of a memory-mapped maze, reopened if it exists, otherwise created and generated there
+        memmapPath: str = None
+        if 'memmapMaze' in configDict.keys():
+            memmapPath = configDict['memmapMaze']
+
+        # Optional: directory caching generated mazes by seed and generation parameters, and its size limit in bytes
+        mazeCache: MazeCache = None
+        if 'mazeCache' in configDict.keys():
+            if 'mazeCacheBytes' in configDict.keys():
+                mazeCache = MazeCache(configDict['mazeCache'], configDict['mazeCacheBytes'])
+            else:
+                mazeCache = MazeCache(configDict['mazeCache'])
 
         # Initialise maze object
-        maze: Maze = Maze(rowNum, colNum, itemParams)
+        # timer for construction of the cells, boundary and edges
+        startConstructTime: float = time.perf_counter()
+        if memmapPath != None:
+            # a stored maze is only reopened if it was generated or read the same way
+            genParams = {'randSeed': randSeed, 'randomWallRemovalPercent': randWall, 'wallRemoval': wallRemoval,
+                         'generator': generatorName, 'entrances': entrances, 'exits': exits}
+            if fileMaze:
+                genParams = {'mazeFileName': configDict['mazeFileName'], 'randSeed': randSeed, 'entrances': entrances,
+                             'exits': exits}
+            maze: Maze = MemmapMaze(memmapPath, rowNum, colNum, itemParams, genParams)
+        else:
+            maze: Maze = Maze(rowNum, colNum, itemParams, graphType)
+        endConstructTime: float = time.perf_counter()
+        print(f'Construction took {endConstructTime - startConstructTime:0.4f} seconds')
+        if hasattr(maze.m_graph, 'bytesPerCell'):
+            print(f'Maze storage uses {maze.bytesPerCell():0.3f} bytes per cell')
 
         # initialise knapsack object
-        knapsack: Knapsack = Knapsack(capacity, knapsackSolver)
+        knapsack: Knapsack = Knapsack(capacity, knapsackSolver, knapsackTable, knapsackCacheSize, epsilon)
 
         # add the entrances and exits
         for [r, c] in entrances:
@@ -135,23 +206,36 @@ if __name__ == '__main__':
         for [r, c] in exits:
             maze.addExit(Coordinates(r, c))
 
+        # Reopen a previously generated or read memory-mapped maze
+        if memmapPath != None and maze.isReopened():
+            print(f'Maze reopened from {memmapPath}')
+            isMazeGenerated = True
+
         # reading the maze information from the file
-        if fileMaze:
+        elif fileMaze:
             mazeFileName = configDict['mazeFileName']
-            reader = MazeReader(mazeFileName)
+            reader = MazeReader(mazeFileName, mazeParser)
             reader.readMaze(maze)
             isMazeGenerated = reader.isMazeGenerated()
+            if memmapPath != None and isMazeGenerated:
+                maze.flush()
 
         # Generate maze
         else:
-            generator = MazeGenerator(randWall)
+            # a memory-mapped maze is already stored on disk, so it is not cached
+            generator = MazeGenerator(randWall, wallRemoval, generatorName, workers,
+                                      mazeCache if memmapPath == None else None)
             # timer for generation
             startGenTime: float = time.perf_counter()
-            generator.generateMaze(maze)
+            generator.generateMaze(maze, randSeed)
             isMazeGenerated = generator.isMazeGenerated()
             # stop timer
             endGenTime: float = time.perf_counter()
             print(f'Generation took {endGenTime - startGenTime:0.4f} seconds')
+            if mazeCache != None:
+                print(f'Maze cache: {mazeCache.hits()} hits, {mazeCache.misses()} misses')
+            if memmapPath != None:
+                maze.flush()
 
         mazeEntrances: List[Coordinates] = maze.getEntrances()
         mazeExits: List[Coordinates] = maze.getExits()
@@ -186,10 +270,7 @@ if __name__ == '__main__':
         # --------------------------------------------------------------------
         if hasattr(knapsack, 'optimalCells') and knapsack.optimalCells is not None:
             import csv
-            if knapsack.knapsackSolver == "recur":
-                output_filename = "Knapsack_recur_items.csv"
-            elif knapsack.knapsackSolver == "dynamic":
-                output_filename = "Knapsack_dynamic_items.csv"
+            output_filename = f"Knapsack_{knapsack.knapsackSolver}_items.csv"
             with open(output_filename, "w", newline="") as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(["Item"])
@@ -198,3 +279,18 @@ if __name__ == '__main__':
                 writer.writerow([knapsack.optimalValue])
             print(f"\nKnapsack items saved in {output_filename}")
 
+        # Optimal knapsack for each of the sweep capacities, from a single solve at the largest of them
+        if knapsackSweep != None and isMazeGenerated:
+            import csv
+            startSweepTime: float = time.perf_counter()
+            sweep = knapsack.sweepCapacities(maze, knapsackSweep)
+            endSweepTime: float = time.perf_counter()
+            print(f'Sweep of {len(knapsackSweep)} capacities took {endSweepTime - startSweepTime:0.4f} seconds')
+            sweepFilename = csvFilename + '_sweep.csv'
+            with open(sweepFilename, "w", newline="") as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["Capacity", "Weight", "Value", "Items"])
+                for sweepCapacity, (cells, weight, value) in zip(knapsackSweep, sweep):
+                    print(f'Capacity {sweepCapacity}: value {value}, weight {weight}, items {cells}')
+                    writer.writerow([sweepCapacity, weight, value, ' '.join(str(cell) for cell in cells)])
+            print(f"Knapsack sweep saved in {sweepFilename}")
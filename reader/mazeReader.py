@@ -7,8 +7,17 @@
 # -------------------------------------------------------------------
 
 
+import mmap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from maze.maze import Maze
 from maze.util import Coordinates
+from maze.gridGraph import GridGraph
+from reader.mazeWriter import MAGIC, VERSION, HEADER, wallPlaneBytes, openMazeFile, compressionOf
 
 
 
@@ -17,10 +26,14 @@ class MazeReader():
     Base class for reading and updating a maze from a file.
     """
 
-    def __init__(self, mazeFname):
+    def __init__(self, mazeFname, parser: str = "stream"):
         # Flag to indicate whether the maze has been read and updated successfully.
         self.m_mazeGenerated: bool = False
         self.mazeFname = mazeFname
+        # how text maze files are parsed, "stream" (line by line, bounded memory) or "numpy" (whole file, vectorised)
+        if parser not in ("stream", "numpy"):
+            raise Exception("Incorrect maze parser used.")
+        self.m_parser = parser
 
 
     def isMazeGenerated(self) -> bool:
@@ -34,9 +47,13 @@ class MazeReader():
         Reads the maze file, updates the cell weights and walls, and sets the m_mazeGenerated flag.
         """
         try:
-            weights = self.loadWeights(self.mazeFname)
-            self.update_cell_weights(maze, weights)
-            self.update_cell_walls(maze, self.mazeFname)
+            if self.isBinary(self.mazeFname):
+                self.readBinary(maze, self.mazeFname)
+                print("Cell weights updated.")
+            elif self.m_parser == "numpy":
+                self.parseNumpy(maze, self.mazeFname)
+            else:
+                self.streamMaze(maze, self.mazeFname)
             self.m_mazeGenerated = True
         except Exception as e:
             print(f"Error reading maze file: {e}")
@@ -48,7 +65,7 @@ class MazeReader():
         and values are the corresponding cell weights.
         """
         m_weights = {}
-        with open(fname, 'r') as file:
+        with openMazeFile(fname) as file:
             for i, line in enumerate(file):
                 lineInfo = list(map(int, line.strip().split()))
 
@@ -65,11 +82,9 @@ class MazeReader():
         
         :param weights: A dictionary containing the weights keyed by (row, column) tuples.
         """
-        for vertex in maze.getVetrices():  
-            row = vertex.getRow()
-            col = vertex.getCol()
-            if (row, col) in weights:
-                vertex.m_weight = weights[(row, col)]  # Directly setting the weight of the Coordinate object
+        for (row, col), weight in weights.items():
+            if 0 <= row < maze.rowNum() and 0 <= col < maze.colNum():
+                maze.setRowWeights(row, [weight], col)
         
         print("Cell weights updated.")
 
@@ -77,7 +92,7 @@ class MazeReader():
         """
         Updates the walls of the maze based on the file input. 
         """
-        with open(fname, 'r') as file:
+        with openMazeFile(fname) as file:
             for i, line in enumerate(file):
                 lineInfo = list(map(int, line.strip().split()))
                 
@@ -88,17 +103,179 @@ class MazeReader():
                     # Update the walls between cells
                     for col in range(len(walls)):
                         if walls[col] == 0:
-                            maze.removeWall(Coordinates(row, col), Coordinates(row, col + 1))
+                            maze.removeWall(maze.getCell(row, col), maze.getCell(row, col + 1))
 
                 # Even lines represent horizontal walls
                 else:
                     walls = lineInfo
                     for col in range(len(walls)):
                         if walls[col] == 0:
-                            maze.removeWall(Coordinates(row, col), Coordinates(row + 1, col))
+                            maze.removeWall(maze.getCell(row, col), maze.getCell(row + 1, col))
         
         print("Cell walls updated.")
 
 
+    def streamMaze(self, maze, fname):
+        """
+        Updates the cell weights and walls of the maze in a single pass over the file, parsing each
+        line once and holding only the current line in memory.
+        Even lines hold the weights of a row interleaved with the walls between its cells,
+        odd lines the walls between that row and the next.
+        """
+        rowNum = maze.rowNum()
+        colNum = maze.colNum()
+        graph = maze.m_graph
+        isGrid = isinstance(graph, GridGraph)
+
+        with openMazeFile(fname) as file:
+            for i, line in enumerate(file):
+                lineInfo = line.split()
+                row = i // 2
+
+                if i % 2 == 0:
+                    weights = lineInfo[0::2]
+                    walls = lineInfo[1::2]
+                    if row >= rowNum or len(weights) > colNum or len(walls) > colNum:
+                        raise Exception('Maze file does not match the maze dimensions.')
+
+                    maze.setRowWeights(row, [int(weight) for weight in weights])
+                    if isGrid:
+                        wallStart = row * (colNum + 1) + 1
+                        for col, wall in enumerate(walls):
+                            if int(wall) == 0:
+                                graph.writeWall(graph.m_vertWalls, wallStart + col, False)
+                    else:
+                        for col, wall in enumerate(walls):
+                            if int(wall) == 0:
+                                maze.removeWall(maze.getCell(row, col), maze.getCell(row, col + 1))
+
+                else:
+                    if row >= rowNum or len(lineInfo) > colNum:
+                        raise Exception('Maze file does not match the maze dimensions.')
+
+                    if isGrid:
+                        wallStart = (row + 1) * colNum
+                        for col, wall in enumerate(lineInfo):
+                            if int(wall) == 0:
+                                graph.writeWall(graph.m_horiWalls, wallStart + col, False)
+                    else:
+                        for col, wall in enumerate(lineInfo):
+                            if int(wall) == 0:
+                                maze.removeWall(maze.getCell(row, col), maze.getCell(row + 1, col))
+
+        print("Cell weights updated.")
+        print("Cell walls updated.")
+
+
+    def parseNumpy(self, maze, fname):
+        """
+        Parses a whole text maze file with NumPy, slices it into weight and wall matrices,
+        and hands them to the maze in bulk.  Holds the file and its tokens in memory.
+        Files that do not hold exactly the cells of the maze are read by streamMaze instead.
+        """
+        if np is None:
+            raise Exception('NumPy is needed for the numpy maze parser.')
+
+        rowNum = maze.rowNum()
+        colNum = maze.colNum()
+        with openMazeFile(fname, 'rb') as file:
+            tokens = np.fromstring(file.read(), dtype=np.int64, sep=' ')
+
+        # each row is an even line of 2*colNum-1 tokens followed by an odd line of colNum tokens, bar the last
+        rowLen = 3 * colNum - 1
+        if len(tokens) != rowNum * rowLen - colNum:
+            self.streamMaze(maze, fname)
+            return
+        rows = np.concatenate((tokens, np.ones(colNum, dtype=np.int64))).reshape(rowNum, rowLen)
+
+        # only walls marked 0 are removed, the rest keep their current status
+        horiWalls, vertWalls = maze.wallArrays()
+        horiWalls = np.array(horiWalls, dtype=np.bool_)
+        vertWalls = np.array(vertWalls, dtype=np.bool_)
+        horiWalls[1:rowNum] &= rows[:rowNum - 1, 2 * colNum - 1:] != 0
+        vertWalls[:, 1:colNum] &= rows[:, 1:2 * colNum - 1:2] != 0
+
+        maze.setArrays(horiWalls, vertWalls, rows[:, 0:2 * colNum - 1:2])
+
+        print("Cell weights updated.")
+        print("Cell walls updated.")
+
+
+    def isBinary(self, fname) -> bool:
+        """
+        @returns True if the file is in the binary maze format written by MazeWriter, rather than text.
+        """
+        with openMazeFile(fname, 'rb') as file:
+            return file.read(len(MAGIC)) == MAGIC
+
+
+    def readBinary(self, maze, fname):
+        """
+        Loads a binary maze file.  Uncompressed files are memory mapped, so only the bytes copied into
+        the maze are read; compressed ones are decompressed into memory.
+        """
+        if np is None:
+            raise Exception('NumPy is needed to read binary maze files.')
+
+        if compressionOf(fname) is not None:
+            with openMazeFile(fname, 'rb') as file:
+                self.loadBinary(maze, file.read())
+        else:
+            with open(fname, 'rb') as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self.loadBinary(maze, data)
+
+
+    def loadBinary(self, maze, data):
+        """
+        Updates the maze from the contents of a binary maze file.
+        Entrances and exits in the file are added to the maze if it does not have them yet, those the maze
+        already has stay open, and a non-empty item table in the file replaces the items of the maze.
+
+        @param data: buffer holding the file.
+        """
+        _, version, _, rowNum, colNum, numEntrances, numExits, numItems = HEADER.unpack_from(data)
+        if version != VERSION:
+            raise Exception(f'Unsupported binary maze format version {version}.')
+        if rowNum != maze.rowNum() or colNum != maze.colNum():
+            raise Exception('Maze file does not match the maze dimensions.')
+
+        offset = HEADER.size
+        tables = []
+        for num, width in ((numEntrances, 2), (numExits, 2), (numItems, 4)):
+            tables.append(np.frombuffer(data, dtype='<i4', count=num * width, offset=offset).reshape(num, width).tolist())
+            offset += 4 * num * width
+        entrances, exits, items = tables
+
+        horiLen, vertLen = wallPlaneBytes(rowNum, colNum)
+        horiBits = data[offset:offset + horiLen]
+        offset += horiLen
+        vertBits = data[offset:offset + vertLen]
+        offset += vertLen
+        offset += -offset % 4
+        weights = np.frombuffer(data, dtype='<i4', count=rowNum * colNum, offset=offset).reshape(rowNum, colNum)
+
+        if isinstance(maze.m_graph, GridGraph):
+            maze.m_graph.setPackedWalls(horiBits, vertBits)
+            maze.setWeights(weights)
+        else:
+            horiWalls = np.unpackbits(np.frombuffer(horiBits, dtype=np.uint8), count=(rowNum + 1) * colNum,
+                                      bitorder='little').astype(np.bool_).reshape(rowNum + 1, colNum)
+            vertWalls = np.unpackbits(np.frombuffer(vertBits, dtype=np.uint8), count=rowNum * (colNum + 1),
+                                      bitorder='little').astype(np.bool_).reshape(rowNum, colNum + 1)
+            maze.setArrays(horiWalls, vertWalls, weights)
+
+        # the wall planes replace every wall, so reopen the boundary walls of the entrances and exits the maze
+        # already has, as the text parsers only ever remove walls
+        for cell in maze.getEntrances() + maze.getExits():
+            inner = maze.getCell(min(max(cell.getRow(), 0), rowNum - 1), min(max(cell.getCol(), 0), colNum - 1))
+            maze.removeWall(cell, inner)
 
-	
\ No newline at end of file
+        for r, c in entrances:
+            if Coordinates(r, c) not in maze.getEntrances():
+                maze.addEntrance(maze.getCell(r, c))
+        for r, c in exits:
+            if Coordinates(r, c) not in maze.getExits():
+                maze.addExit(maze.getCell(r, c))
+        if numItems > 0:
+            maze.m_items = {(r, c): [weight, value] for r, c, weight, value in items}
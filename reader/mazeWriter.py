@@ -0,0 +1,176 @@
+# -------------------------------------------------------------------
+# Writer for maze files, in the text format or the binary format that
+# MazeReader loads by memory mapping, optionally compressed.
+# Also converts text maze files to the binary format.
+#
+# Run from the project root to convert a text maze file:
+#   python -m reader.mazeWriter <text maze file> <output maze file>
+# The output is in the binary format, unless its name ends in .txt.
+# Either file may end in .gz, .bz2 or .xz to be compressed, e.g.,
+# maze.txt.xz is an xz compressed text maze file.
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import sys
+import struct
+import gzip
+import bz2
+import lzma
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maze.maze import Maze
+
+
+# Binary maze file layout, all little endian:
+# - header: magic, format version, flags (0), rowNum, colNum, number of entrances, exits and items.
+# - entrances, then exits: int32 (row, col) pairs.
+# - items: int32 (row, col, weight, value) quadruples.
+# - horizontal then vertical walls: bit planes laid out as in BitGridGraph, each padded to a whole byte.
+# - padding to a multiple of 4 bytes, then the rowNum x colNum int32 cell weights.
+MAGIC = b'RMITMAZE'
+VERSION = 1
+HEADER = struct.Struct('<8sHHIIIII')
+
+
+# supported compressions: leading bytes of compressed files, file extension and codec module
+COMPRESSIONS = ((b'\x1f\x8b', '.gz', gzip), (b'BZh', '.bz2', bz2), (b'\xfd7zXZ\x00', '.xz', lzma))
+
+
+def compressionOf(fname, forWriting: bool = False):
+    """
+    Works out how a maze file is compressed: from its leading bytes when reading, from its extension when writing.
+
+    @returns Codec module (gzip, bz2 or lzma), or None if the file is not compressed.
+    """
+    if forWriting:
+        for _, extension, codec in COMPRESSIONS:
+            if str(fname).endswith(extension):
+                return codec
+        return None
+
+    with open(fname, 'rb') as file:
+        head = file.read(6)
+    for magic, _, codec in COMPRESSIONS:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def openMazeFile(fname, mode: str = 'r'):
+    """
+    Opens a maze file like open(), transparently streaming it through the gzip, bz2 or xz codec if it is compressed.
+
+    @param mode: 'r', 'w', 'rb' or 'wb'.
+    """
+    codec = compressionOf(fname, 'w' in mode)
+    if codec is None:
+        return open(fname, mode)
+    return codec.open(fname, mode if 'b' in mode else mode + 't')
+
+
+def wallPlaneBytes(rowNum: int, colNum: int) -> tuple:
+    """
+    @returns Sizes in bytes of the packed (horizontal, vertical) wall planes of a rowNum x colNum maze.
+    """
+    return ((rowNum + 1) * colNum + 7) // 8, (rowNum * (colNum + 1) + 7) // 8
+
+
+class MazeWriter():
+    """
+    Writes mazes to maze files, compressed if the file name ends in .gz, .bz2 or .xz.
+    """
+
+    def __init__(self, mazeFname):
+        self.mazeFname = mazeFname
+
+
+    def writeMaze(self, maze: Maze):
+        """
+        Writes the walls, cell weights, entrances, exits and items of the maze in the binary format.
+        """
+        if np is None:
+            raise Exception('NumPy is needed to write binary maze files.')
+
+        horiWalls, vertWalls, weights = maze.toArrays()
+        entrances = [[cell.getRow(), cell.getCol()] for cell in maze.getEntrances()]
+        exits = [[cell.getRow(), cell.getCol()] for cell in maze.getExits()]
+        items = [[r, c, weight, value] for (r, c), (weight, value) in maze.m_items.items()]
+
+        with openMazeFile(self.mazeFname, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, maze.rowNum(), maze.colNum(), len(entrances), len(exits), len(items)))
+            for table in (entrances, exits, items):
+                file.write(np.array(table, dtype='<i4').tobytes())
+
+            horiBits = np.packbits(np.asarray(horiWalls, dtype=np.bool_).reshape(-1), bitorder='little').tobytes()
+            vertBits = np.packbits(np.asarray(vertWalls, dtype=np.bool_).reshape(-1), bitorder='little').tobytes()
+            file.write(horiBits)
+            file.write(vertBits)
+            file.write(bytes(-(len(horiBits) + len(vertBits)) % 4))
+
+            file.write(np.ascontiguousarray(weights, dtype='<i4').tobytes())
+
+
+    def writeText(self, maze: Maze):
+        """
+        Writes the walls and cell weights of the maze in the text format, one row at a time.
+        Even lines hold the cell weights of a row interleaved with the walls between its cells,
+        odd lines the walls between that row and the next (1 for a wall, 0 for none).
+        """
+        rowNum = maze.rowNum()
+        colNum = maze.colNum()
+
+        with openMazeFile(self.mazeFname, 'w') as file:
+            for r in range(rowNum):
+                tokens = [str(maze.getCell(r, 0).getWeight())]
+                for c in range(1, colNum):
+                    tokens.append('1' if maze.hasWall(maze.getCell(r, c - 1), maze.getCell(r, c)) else '0')
+                    tokens.append(str(maze.getCell(r, c).getWeight()))
+                file.write(' '.join(tokens) + '\n')
+
+                if r < rowNum - 1:
+                    file.write(' '.join('1' if maze.hasWall(maze.getCell(r, c), maze.getCell(r + 1, c)) else '0'
+                                        for c in range(colNum)) + '\n')
+
+
+def textMazeDimensions(mazeFname) -> tuple:
+    """
+    @returns (rowNum, colNum) of a text maze file, from its line count and the length of its first line.
+    """
+    rowNum = 0
+    colNum = 0
+    with openMazeFile(mazeFname) as file:
+        for i, line in enumerate(file):
+            if i == 0:
+                colNum = (len(line.split()) + 1) // 2
+            if i % 2 == 0:
+                rowNum += 1
+    return rowNum, colNum
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print('python3 -m reader.mazeWriter', '<text maze file> <output maze file>')
+        sys.exit(1)
+
+    from reader.mazeReader import MazeReader
+
+    rowNum, colNum = textMazeDimensions(sys.argv[1])
+    maze = Maze(rowNum, colNum, [0, 1, 1], "grid")
+    reader = MazeReader(sys.argv[1])
+    reader.readMaze(maze)
+    if not reader.isMazeGenerated():
+        sys.exit(1)
+    outFname = sys.argv[2]
+    for _, extension, _ in COMPRESSIONS:
+        if outFname.endswith(extension):
+            outFname = outFname[:-len(extension)]
+    if outFname.endswith('.txt'):
+        MazeWriter(sys.argv[2]).writeText(maze)
+    else:
+        MazeWriter(sys.argv[2]).writeMaze(maze)
+    print(f'Wrote {rowNum} x {colNum} maze to {sys.argv[2]}')
@@ -13,6 +13,7 @@ from maze.maze import Maze
 
 from knapsack.knapsack import Knapsack
 from itertools import permutations
+from collections import deque
 
 from typing import List, Dict, Optional
 
@@ -45,11 +46,11 @@ class KnapsackSolver:
             return [start]
 
         visited = set()
-        queue = [start]
+        queue = deque([start])
         predecessors: Dict[Coordinates, Optional[Coordinates]] = {start: None}
 
         while queue:
-            curr = queue.pop(0)
+            curr = queue.popleft()
 
             if curr == goal:
                 # Reconstruct path from goal to start
@@ -84,7 +85,7 @@ class KnapsackSolver:
         # make sure everything is a coordinate type
 
         for i in range(1, len(points) - 1):
-            points[i] = Coordinates(points[i][0], points[i][1])
+            points[i] = maze.getCell(points[i][0], points[i][1])
 
         # find minimum paths between all points
         distances = {}  # distances between each pair of points
@@ -0,0 +1,77 @@
+# -------------------------------------------------------------------
+# Microbenchmark for Coordinates hashing in dict/set heavy loops.
+# Run from the project root with:
+#   python -m testing.benchmarks.coordinatesBench [rows] [cols]
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import sys
+import time
+
+from maze.util import Coordinates
+
+
+class StringHashCoordinates:
+    """
+    The previous Coordinates: __dict__ instances, getter based equality, string hash.
+    """
+
+    def __init__(self, row: int, col: int):
+        self.m_r = row
+        self.m_c = col
+        self.m_weight = 0
+
+    def getRow(self) -> int:
+        return self.m_r
+
+    def getCol(self) -> int:
+        return self.m_c
+
+    def __eq__(self, other):
+        if other != None:
+            return self.m_r == other.getRow() and self.m_c == other.getCol()
+        else:
+            return False
+
+    def __hash__(self):
+        return hash(str(self.m_r)+'|'+str(self.m_c))
+
+
+def bfsLikeLoop(cls, rowNum: int, colNum: int, canonical: bool) -> float:
+    """
+    Times the visited set / predecessor dict pattern of KnapsackSolver.bfs over a full grid.
+
+    @param cls: Coordinates class to benchmark.
+    @param canonical: if True, reuse one instance per cell (as Maze.getCell does), otherwise allocate per lookup.
+    @return: elapsed seconds.
+    """
+    cells = {(r, c): cls(r, c) for r in range(rowNum) for c in range(colNum)}
+
+    start = time.perf_counter()
+    visited = set()
+    predecessors = {}
+    for r in range(rowNum):
+        for c in range(colNum):
+            curr = cells[(r, c)] if canonical else cls(r, c)
+            visited.add(curr)
+            for dr, dc in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+                key = (r + dr, c + dc)
+                if key not in cells:
+                    continue
+                neigh = cells[key] if canonical else cls(*key)
+                if neigh not in visited and neigh not in predecessors:
+                    predecessors[neigh] = curr
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rowNum = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    colNum = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    print(f'{rowNum}x{colNum} grid, BFS-style visited/predecessor loop')
+    for name, cls in (('string hash', StringHashCoordinates), ('slotted tuple hash', Coordinates)):
+        for canonical in (False, True):
+            elapsed = bfsLikeLoop(cls, rowNum, colNum, canonical)
+            mode = 'canonical instances' if canonical else 'new instances'
+            print(f'{name:>20}, {mode:<20}: {elapsed:0.4f} seconds')
@@ -0,0 +1,46 @@
+# -------------------------------------------------------------------
+# Benchmark of the peak memory of the dynamic knapsack table against
+# the single row and bit-packed choices of the "dynamic-lean" solver.
+# Run from the project root with:
+#   python -m testing.benchmarks.knapsackMemoryBench [numItems] [capacity] [maxWeight]
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import os
+import sys
+import random
+import tempfile
+import tracemalloc
+
+from knapsack.knapsack import Knapsack
+
+
+def measure(solver, items: list, capacity: int, filename: str) -> int:
+    """
+    Runs a knapsack solver method under tracemalloc.  Timings would be skewed by the tracing, so none are taken.
+
+    @return: peak bytes allocated.
+    """
+    tracemalloc.start()
+    solver(items, capacity, len(items), filename)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == '__main__':
+    numItems = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    maxWeight = int(sys.argv[3]) if len(sys.argv) > 3 else capacity // 10
+
+    random.seed(1)
+    items = [[(i, 0), random.randint(1, maxWeight), random.randint(1, 100)] for i in range(numItems)]
+    knapsack = Knapsack(capacity, "dynamic-lean")
+
+    print(f'{numItems} items, capacity {capacity}, maxWeight {maxWeight}')
+    with tempfile.TemporaryDirectory() as tmpDir:
+        filename = os.path.join(tmpDir, 'table')
+        for name, solver in (('table', knapsack.dynamicKnapsack), ('lean', knapsack.leanDynamicKnapsack)):
+            peak = measure(solver, items, capacity, filename)
+            print(f'{name:>5}: peak {peak / 2**20:0.2f} MB')
@@ -0,0 +1,59 @@
+# -------------------------------------------------------------------
+# Benchmark of loading a maze from a text maze file, with the streaming
+# and the NumPy parsers, against the same maze in the binary format.
+# Run from the project root with:
+#   python -m testing.benchmarks.mazeLoadBench [rows] [cols] [graphType]
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+from maze.maze import Maze
+from reader.mazeReader import MazeReader
+from reader.mazeWriter import MazeWriter
+from generator.ellerGenerator import EllerMazeGenerator
+
+
+def timeLoad(fname: str, rowNum: int, colNum: int, graphType: str, parser: str = "stream") -> float:
+    """
+    Times reading a maze file into a new maze, not counting the construction of the maze.
+
+    @return: elapsed seconds.
+    """
+    maze = Maze(rowNum, colNum, [0, 1, 1], graphType)
+    reader = MazeReader(fname, parser)
+
+    start = time.perf_counter()
+    reader.readMaze(maze)
+    elapsed = time.perf_counter() - start
+
+    if not reader.isMazeGenerated():
+        raise Exception('Could not read ' + fname)
+    return elapsed
+
+
+if __name__ == '__main__':
+    rowNum = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    colNum = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    graphType = sys.argv[3] if len(sys.argv) > 3 else 'grid'
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        textFname = os.path.join(tmpDir, 'maze.txt')
+        binaryFname = os.path.join(tmpDir, 'maze.bin')
+
+        random.seed(1)
+        EllerMazeGenerator().writeMaze(textFname, rowNum, colNum, 10)
+        maze = Maze(rowNum, colNum, [0, 1, 1], graphType)
+        MazeReader(textFname).readMaze(maze)
+        MazeWriter(binaryFname).writeMaze(maze)
+
+        print(f'{rowNum}x{colNum} {graphType} maze')
+        for name, fname, parser in (('text', textFname, 'stream'), ('text', textFname, 'numpy'), ('binary', binaryFname, 'stream')):
+            elapsed = timeLoad(fname, rowNum, colNum, graphType, parser)
+            label = name if name == 'binary' else f'{name} ({parser})'
+            print(f'{label:>13}: {os.path.getsize(fname) / 2**20:0.2f} MB, loaded in {elapsed:0.4f} seconds')
@@ -0,0 +1,50 @@
+# -------------------------------------------------------------------
+# Benchmark of the "pareto" knapsack solver against the dynamic
+# programming table ("dynamic-lean"), across magnitudes of maxWeight
+# and ratios of knapsackCapacity to maxWeight.  The table is skipped
+# for capacities above tableLimit, as its time grows with them.
+# Run from the project root with:
+#   python -m testing.benchmarks.paretoBench [numItems] [maxValue] [tableLimit]
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import sys
+import time
+import random
+
+from knapsack.knapsack import Knapsack
+
+
+def timeSolver(solver, items: list, capacity: int) -> tuple:
+    """
+    @return: (optimal value, elapsed seconds) of a knapsack solver method.
+    """
+    start = time.perf_counter()
+    _, _, value = solver(items, capacity, len(items))
+    return value, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    numItems = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    maxValue = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    tableLimit = int(sys.argv[3]) if len(sys.argv) > 3 else 200000
+
+    # sampleConfig.json has maxWeight 5 and knapsackCapacity 15, a ratio of 3
+    print(f'{numItems} items, maxValue {maxValue}')
+    for maxWeight in (5, 50, 500, 5000, 50000):
+        for ratio in (0.5, 1, 3, 10, 100):
+            capacity = int(ratio * maxWeight)
+            random.seed(1)
+            items = [[(i, 0), random.randint(1, maxWeight), random.randint(1, maxValue)] for i in range(numItems)]
+            knapsack = Knapsack(capacity, "pareto")
+
+            paretoValue, paretoTime = timeSolver(knapsack.paretoKnapsack, items, capacity)
+            if capacity > tableLimit:
+                print(f'maxWeight {maxWeight:>6}, capacity {ratio:>5} x maxWeight: pareto {paretoTime:0.4f} seconds, table skipped')
+                continue
+            tableValue, tableTime = timeSolver(lambda its, cap, n: knapsack.leanDynamicKnapsack(its, cap, n, None), items, capacity)
+            if paretoValue != tableValue:
+                raise Exception('Solvers disagree on the optimal value.')
+            print(f'maxWeight {maxWeight:>6}, capacity {ratio:>5} x maxWeight: pareto {paretoTime:0.4f} seconds, '
+                  f'table {tableTime:0.4f} seconds')
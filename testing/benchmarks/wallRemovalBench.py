@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------
+# Benchmark of the random wall removal phase of maze generation,
+# exact (reproduces seeded mazes) against batched (vectorised draws).
+# Run from the project root with:
+#   python -m testing.benchmarks.wallRemovalBench [rows] [cols] [graphType]
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import sys
+import time
+import random
+
+from maze.maze import Maze
+from maze.gridGraph import GridGraph
+from generator.recurBackGenerator import RecurBackMazeGenerator
+
+
+def timeRemoval(rowNum: int, colNum: int, graphType: str, randWall: int, batched: bool) -> float:
+    """
+    Carves a maze, then times only the random wall removal.
+
+    @return: elapsed seconds.
+    """
+    random.seed(1)
+    maze = Maze(rowNum, colNum, [1, 1, 1], graphType)
+    generator = RecurBackMazeGenerator()
+    # carve the passages as RecurBackMazeGenerator.generateMaze does for the graph type
+    if isinstance(maze.m_graph, GridGraph):
+        generator.carveGrid(maze)
+    else:
+        generator.carvePassages(maze)
+
+    start = time.perf_counter()
+    if batched:
+        generator.removeRandomWallsBatched(maze, randWall)
+    else:
+        generator.removeRandomWalls(maze, randWall)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rowNum = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    colNum = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    graphType = sys.argv[3] if len(sys.argv) > 3 else 'grid'
+
+    print(f'{rowNum}x{colNum} {graphType} maze, random wall removal')
+    for randWall in (10, 40, 80):
+        exact = timeRemoval(rowNum, colNum, graphType, randWall, False)
+        batched = timeRemoval(rowNum, colNum, graphType, randWall, True)
+        print(f'{randWall:>3}%: exact {exact:0.4f} seconds, batched {batched:0.4f} seconds')
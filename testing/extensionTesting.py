@@ -0,0 +1,507 @@
+#!/usr/bin/env python
+# -------------------------------------------------------------------
+# Behaviour checks for the maze file formats, graph types and extra
+# knapsack solvers, next to the basic checks in student_testing.py.
+# Run from the project root with:
+#   python -m testing.extensionTesting
+#
+# __copyright__ = 'Copyright 2025, RMIT University'
+# -------------------------------------------------------------------
+
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maze.maze import Maze
+from maze.memmapMaze import MemmapMaze
+from generator.mazeGenerator import MazeGenerator
+from generator.mazeCache import MazeCache
+from generator.tiledGenerator import TiledMazeGenerator
+from knapsack.knapsack import Knapsack
+from reader.mazeReader import MazeReader
+from reader.mazeWriter import MazeWriter
+
+
+# colours for testing
+GREEN = '\033[92m'
+RED = '\033[91m'
+RESET = '\033[0m'
+
+# odd dimensions, so the wall bit planes do not end on a byte boundary
+ROW_NUM = 13
+COL_NUM = 17
+ITEM_PARAMS = [9, 6, 8]
+SEED = 58
+ENTRANCE = (3, -1)
+EXIT = (-1, 3)
+
+MAZE_FILES = ['maze.txt', 'maze.txt.gz', 'maze.txt.bz2', 'maze.txt.xz',
+              'maze.bin', 'maze.bin.gz', 'maze.bin.bz2', 'maze.bin.xz']
+GRAPH_TYPES = ['edgeList', 'grid', 'bitGrid', 'memmap']
+PARSERS = ['stream', 'numpy']
+
+CONFIG_FILE = 'testing/testingConfig.json'
+EXTENSION_CONFIG_FILE = 'testing/testingConfig_extension.json'
+RECUR_EXPECTED = 'testing/expected_outputs/recurTest.txt'
+DYNAMIC_EXPECTED = 'testing/expected_outputs/dynamicTest.csv'
+# solver whose knapsack value the others are checked against ("dynamic" itself is left to students)
+REFERENCE_SOLVER = 'dynamic-lean'
+# solvers that log the recursive call count as "recur" does
+RECUR_SOLVERS = ['recur-memo', 'recur-iter']
+# solvers that save the dynamic programming table as "dynamic" does
+TABLE_SOLVERS = ['dynamic-lean', 'dynamic-numpy']
+EXACT_SOLVERS = TABLE_SOLVERS + RECUR_SOLVERS + ['branch-bound', 'pareto', 'dynamic-hirschberg',
+                                                   'incremental']
+EPSILON = 0.1
+
+
+def report(passed: bool, message: str) -> bool:
+    """
+    Prints the outcome of a check.
+
+    @return passed.
+    """
+    if passed:
+        print(f'{GREEN}PASS{RESET}: {message}')
+    else:
+        print(f'{RED}FAIL{RESET}: {message}')
+    return passed
+
+
+def buildMaze() -> Maze:
+    """
+    @return seeded maze with items, an entrance, an exit and a distinct random weight in most cells.
+    """
+    random.seed(SEED)
+    maze = Maze(ROW_NUM, COL_NUM, ITEM_PARAMS, 'grid')
+    maze.addEntrance(maze.getCell(*ENTRANCE))
+    maze.addExit(maze.getCell(*EXIT))
+    MazeGenerator(15).generateMaze(maze, SEED)
+    maze.setWeights(np.random.RandomState(SEED).randint(1, 1000, (ROW_NUM, COL_NUM)))
+    return maze
+
+
+def readMaze(fname: str, addEnds: bool, graphType: str, parser: str, tmpDir: str) -> Maze:
+    """
+    Reads a maze file into a new maze.  A memory-mapped maze is flushed and reopened before it is returned,
+    so what it stored on disk is checked rather than what it holds in memory.
+
+    @param addEnds: whether to add the entrance and exit before reading, as mazeRunner.py adds them from its
+        configuration; text files do not store them.
+    """
+    if graphType == 'memmap':
+        path = os.path.join(tmpDir, 'memmap')
+        shutil.rmtree(path, ignore_errors=True)
+        genParams = {'mazeFileName': fname}
+        maze = MemmapMaze(path, ROW_NUM, COL_NUM, [0, 1, 1], genParams)
+    else:
+        maze = Maze(ROW_NUM, COL_NUM, [0, 1, 1], graphType)
+
+    if addEnds:
+        maze.addEntrance(maze.getCell(*ENTRANCE))
+        maze.addExit(maze.getCell(*EXIT))
+    MazeReader(fname, parser).readMaze(maze)
+
+    if graphType == 'memmap':
+        maze.flush()
+        del maze
+        maze = MemmapMaze(path, ROW_NUM, COL_NUM, [0, 1, 1], genParams)
+        if not maze.isReopened():
+            raise Exception('Memory-mapped maze was not reopened.')
+    return maze
+
+
+def mismatches(expected: Maze, actual: Maze, binary: bool) -> list:
+    """
+    @param binary: whether the entrances, exits and items went through the file too; a memory-mapped maze does not
+        store the entrances and exits, as mazeRunner.py adds them from its configuration.
+
+    @return names of the parts of actual that differ from expected.
+    """
+    differ = []
+    for name, want, got in zip(['horizontal walls', 'vertical walls', 'weights'], expected.toArrays(),
+                               actual.toArrays()):
+        if not np.array_equal(np.asarray(want, dtype=np.int64), np.asarray(got, dtype=np.int64)):
+            differ.append(name)
+    if binary:
+        if not isinstance(actual, MemmapMaze):
+            if expected.getEntrances() != actual.getEntrances():
+                differ.append('entrances')
+            if expected.getExits() != actual.getExits():
+                differ.append('exits')
+        if {cell: list(item) for cell, item in expected.m_items.items()} != \
+                {cell: list(item) for cell, item in actual.m_items.items()}:
+            differ.append('items')
+    return differ
+
+
+def testMazeFiles() -> bool:
+    """
+    Writes a maze in every file format and reads each file back into every graph type and a memory-mapped maze.
+    """
+    print('---- TESTING MAZE FILE ROUND TRIPS ----')
+    if np is None:
+        print('NumPy is not installed, skipping (binary maze files and memory-mapped mazes need it).')
+        return True
+
+    maze = buildMaze()
+    passed = True
+    tmpDir = tempfile.mkdtemp()
+    try:
+        for fileName in MAZE_FILES:
+            fname = os.path.join(tmpDir, fileName)
+            binary = '.bin' in fileName
+            if binary:
+                MazeWriter(fname).writeMaze(maze)
+            else:
+                MazeWriter(fname).writeText(maze)
+
+            # the parser only applies to text files
+            for parser in (PARSERS[:1] if binary else PARSERS):
+                for graphType in GRAPH_TYPES:
+                    try:
+                        differ = mismatches(maze, readMaze(fname, not binary, graphType, parser, tmpDir), binary)
+                    except Exception as e:
+                        differ = [f'error "{e}"']
+                    label = f'{fileName} into {graphType}' + ('' if binary else f' ({parser} parser)')
+                    if differ:
+                        passed = report(False, f'{label}: {", ".join(differ)} differ.') and passed
+                    else:
+                        report(True, f'{label} round trips.')
+
+        # a binary file without the entrance and exit, read into mazes that already have them
+        horiWalls, vertWalls, weights = maze.toArrays()
+        horiWalls, vertWalls = horiWalls.copy(), vertWalls.copy()
+        horiWalls[0, EXIT[1]] = True
+        vertWalls[ENTRANCE[0], 0] = True
+        fname = os.path.join(tmpDir, 'closed.bin')
+        MazeWriter(fname).writeMaze(Maze.fromArrays(horiWalls, vertWalls, weights, [0, 1, 1]))
+        for graphType in GRAPH_TYPES:
+            try:
+                differ = mismatches(maze, readMaze(fname, True, graphType, PARSERS[0], tmpDir), False)
+            except Exception as e:
+                differ = [f'error "{e}"']
+            label = f'closed.bin into {graphType} with the entrance and exit added'
+            if differ:
+                passed = report(False, f'{label}: {", ".join(differ)} differ.') and passed
+            else:
+                report(True, f'{label} keeps them open.')
+    finally:
+        shutil.rmtree(tmpDir, ignore_errors=True)
+
+    return passed
+
+
+def testGenerators() -> bool:
+    """
+    Checks that seeded generations carve the same maze on every graph type, so the flat-array walk on grid graphs
+    follows the walk on Coordinates.
+    """
+    print('---- TESTING SEEDED GENERATION ACROSS GRAPH TYPES ----')
+    if np is None:
+        print('NumPy is not installed, skipping (comparing mazes needs it).')
+        return True
+
+    passed = True
+    for seed in [1, SEED, 99]:
+        for rowNum, colNum in [(ROW_NUM, COL_NUM), (1, COL_NUM), (ROW_NUM, 1)]:
+            arrays = {}
+            for graphType in GRAPH_TYPES[:3]:
+                random.seed(seed)
+                maze = Maze(rowNum, colNum, ITEM_PARAMS, graphType)
+                maze.addEntrance(maze.getCell(0, -1))
+                MazeGenerator(0).generateMaze(maze, seed)
+                arrays[graphType] = maze.toArrays()
+            differ = [graphType for graphType in GRAPH_TYPES[1:3]
+                      if not all(np.array_equal(want, got) for want, got in zip(arrays['edgeList'], arrays[graphType]))]
+            label = f'Seed {seed} on a {rowNum}x{colNum} maze'
+            if differ:
+                passed = report(False, f'{label}: {", ".join(differ)} differ from edgeList.') and passed
+            else:
+                report(True, f'{label} carves the same maze on every graph type.')
+
+    return passed
+
+
+def testTiledGeneration() -> bool:
+    """
+    Checks that a seeded tiled generation carves the same maze whatever the number of workers.
+    """
+    print('---- TESTING TILED GENERATION ACROSS WORKER COUNTS ----')
+    if np is None:
+        print('NumPy is not installed, skipping (comparing mazes needs it).')
+        return True
+
+    passed = True
+    for graphType in GRAPH_TYPES[:3]:
+        arrays = {}
+        for workers in [1, 2, 3]:
+            random.seed(SEED)
+            maze = Maze(ROW_NUM, COL_NUM, ITEM_PARAMS, graphType)
+            # small tiles, so the maze is split into several of them
+            TiledMazeGenerator(workers, tileSize=5).generateMaze(maze, 10)
+            arrays[workers] = maze.toArrays()
+        differ = [str(workers) for workers in [2, 3]
+                  if not all(np.array_equal(want, got) for want, got in zip(arrays[1], arrays[workers]))]
+        if differ:
+            passed = report(False, f'Tiled {graphType} maze with {", ".join(differ)} workers differs from 1 worker.') \
+                and passed
+        else:
+            report(True, f'Tiled {graphType} maze is the same with 1, 2 and 3 workers.')
+
+    return passed
+
+
+def generateCached(cache: MazeCache, seed: int) -> tuple:
+    """
+    Generates a seeded maze through the cache, as mazeRunner.py does.
+
+    @return (maze, what the generation printed).
+    """
+    random.seed(seed)
+    maze = Maze(ROW_NUM, COL_NUM, ITEM_PARAMS, 'grid')
+    maze.addEntrance(maze.getCell(*ENTRANCE))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        MazeGenerator(15, cache=cache).generateMaze(maze, seed)
+    return maze, output.getvalue()
+
+
+def testMazeCache() -> bool:
+    """
+    Generates a seeded maze twice through the cache, expecting a miss then a quiet hit with the same maze,
+    then fills a small cache to check the least recently used maze is the one evicted.
+    """
+    print('---- TESTING MAZE CACHE ----')
+    if np is None:
+        print('NumPy is not installed, skipping (the maze cache needs it).')
+        return True
+
+    passed = True
+    tmpDir = tempfile.mkdtemp()
+    try:
+        cache = MazeCache(tmpDir)
+        generated, _ = generateCached(cache, SEED)
+        passed = report((cache.hits(), cache.misses()) == (0, 1), 'First generation is a cache miss.') and passed
+        loaded, printed = generateCached(cache, SEED)
+        passed = report((cache.hits(), cache.misses()) == (1, 1), 'Second generation is a cache hit.') and passed
+        passed = report(not mismatches(generated, loaded, True), 'Cached maze is the generated one.') and passed
+        passed = report(printed == '', 'A cache hit prints nothing.') and passed
+
+        # SEED is used most recently, so the other maze is evicted to make room for a third
+        generateCached(cache, SEED + 1)
+        generateCached(cache, SEED)
+        sizes = {fname: os.path.getsize(os.path.join(tmpDir, fname)) for fname in os.listdir(tmpDir)}
+        cache = MazeCache(tmpDir, sum(sizes.values()) + min(sizes.values()) // 2)
+        generateCached(cache, SEED + 2)
+        generateCached(cache, SEED)
+        evicted = cache.misses() == 1 and cache.hits() == 1 and len(os.listdir(tmpDir)) == 2
+        generateCached(cache, SEED + 1)
+        passed = report(evicted and cache.misses() == 2, 'The least recently used maze is evicted.') and passed
+    finally:
+        shutil.rmtree(tmpDir, ignore_errors=True)
+
+    return passed
+
+
+def runMazeRunner(solver: str, extraConfig: dict):
+    """
+    Runs mazeRunner.py on the testing configuration with another knapsack solver.
+    """
+    with open(CONFIG_FILE, 'r') as f:
+        config = json.load(f)
+    config['knapsackSolver'] = solver
+    config.update(extraConfig)
+    with open(EXTENSION_CONFIG_FILE, 'w') as f:
+        json.dump(config, f, indent=4)
+
+    for output in ['testing.txt', 'testing.csv', f'Knapsack_{solver}_items.csv']:
+        if os.path.exists(output):
+            os.remove(output)
+
+    subprocess.run([sys.executable, 'mazeRunner.py', EXTENSION_CONFIG_FILE], check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def readRows(fname: str) -> list:
+    """
+    @return rows of a CSV file, whatever its line endings.
+    """
+    with open(fname, newline='') as csvfile:
+        return list(csv.reader(csvfile))
+
+
+def readFile(fname: str) -> str:
+    with open(fname, 'r') as f:
+        return f.read().strip()
+
+
+def itemsValue(solver: str) -> int:
+    """
+    @return value of the knapsack items the solver saved.
+    """
+    return int(readRows(f'Knapsack_{solver}_items.csv')[-1][0])
+
+
+def testKnapsackSolvers() -> bool:
+    """
+    Runs the extra knapsack solvers through mazeRunner.py, checking the logs and tables against the expected outputs
+    of "recur" and "dynamic" and the knapsack values against the value "dynamic-lean" finds.
+    """
+    print('---- TESTING EXTRA KNAPSACK SOLVERS ----')
+    solvers = EXACT_SOLVERS + ['approx']
+    if np is None:
+        solvers.remove('dynamic-numpy')
+
+    passed = True
+    values = {}
+    try:
+        for solver in solvers:
+            try:
+                runMazeRunner(solver, {'knapsackTable': True, 'epsilon': EPSILON})
+            except subprocess.CalledProcessError as e:
+                passed = report(False, f'mazeRunner.py failed for {solver} with return code {e.returncode}.') and passed
+                continue
+
+            if solver in RECUR_SOLVERS:
+                passed = report(os.path.exists('testing.txt') and readFile('testing.txt') == readFile(RECUR_EXPECTED),
+                                f'Call count logged by {solver} is as expected.') and passed
+            if solver in TABLE_SOLVERS:
+                passed = report(os.path.exists('testing.csv') and readRows('testing.csv') == readRows(DYNAMIC_EXPECTED),
+                                f'Table saved by {solver} is as expected.') and passed
+            values[solver] = itemsValue(solver)
+
+        optimum = values.get(REFERENCE_SOLVER)
+        for solver in EXACT_SOLVERS:
+            if solver in values and solver != REFERENCE_SOLVER:
+                passed = report(values[solver] == optimum,
+                                f'Value of {solver} ({values[solver]}) is the optimum ({optimum}).') and passed
+        if 'approx' in values:
+            passed = report(optimum is not None and (1 - EPSILON) * optimum <= values['approx'] <= optimum,
+                            f'Value of approx ({values["approx"]}) is within {EPSILON} of the optimum ({optimum}).') \
+                and passed
+
+        runMazeRunner('dynamic-lean', {'knapsackSweep': [0, 5, 10, 15]})
+        # skip the header
+        sweep = readRows('testing_sweep.csv')
+        passed = report(int(sweep[-1][2]) == optimum and all(int(row[2]) <= optimum for row in sweep[1:-1]),
+                        f'Sweep at the knapsack capacity finds the optimum ({optimum}).') and passed
+    finally:
+        for file in ['testing.csv', 'testing.txt', 'testing_sweep.csv', EXTENSION_CONFIG_FILE] + \
+                    [f'Knapsack_{solver}_items.csv' for solver in solvers]:
+            if os.path.exists(file):
+                os.remove(file)
+
+    return passed
+
+
+def loggedCalls(solve, items: list, capacity: int, tmpDir: str) -> str:
+    """
+    @return call count a recursive knapsack solver logs for the items.
+    """
+    fname = os.path.join(tmpDir, 'calls')
+    if os.path.exists(fname + '.txt'):
+        os.remove(fname + '.txt')
+    solve(items, capacity, len(items), fname)
+    return readFile(fname + '.txt')
+
+
+def testCallCounts() -> bool:
+    """
+    Checks that recur-memo logs the call count recur-iter does on items where including or excluding
+    an item first reaches the base case after a different number of calls.
+    """
+    print('---- TESTING RECURSIVE CALL COUNTS ----')
+    knapsack = Knapsack(10, 'recur-memo')
+    rng = random.Random(SEED)
+    cases = [([(0, 5, 1), (1, 5, 1), (2, 5, 1)], 10)] + \
+            [([(i, rng.randint(1, 8), rng.randint(0, 9)) for i in range(rng.randint(1, 8))], rng.randint(1, 20))
+             for _ in range(20)]
+
+    passed = True
+    tmpDir = tempfile.mkdtemp()
+    try:
+        for items, capacity in cases:
+            memo = loggedCalls(knapsack.memoKnapsack, items, capacity, tmpDir)
+            iterative = loggedCalls(knapsack.iterativeKnapsack, items, capacity, tmpDir)
+            if memo != iterative:
+                passed = report(False, f'recur-memo logs {memo} calls, recur-iter {iterative}, for weights '
+                                       f'{[weight for _, weight, _ in items]} and capacity {capacity}.') and passed
+        passed = report(passed and loggedCalls(knapsack.memoKnapsack, *cases[0], tmpDir) == '3',
+                        f'recur-memo logs the call counts of recur-iter on {len(cases)} item lists.') and passed
+    finally:
+        shutil.rmtree(tmpDir, ignore_errors=True)
+
+    return passed
+
+
+def testIncrementalUpdates() -> bool:
+    """
+    Changes the maze items between solves of one "incremental" knapsack, adding, removing and reweighting items
+    so that removals rebuild from checkpoints, and checks each solve against a fresh "dynamic-lean" solve.
+    """
+    print('---- TESTING INCREMENTAL KNAPSACK UPDATES ----')
+    rng = random.Random(SEED)
+    capacity = 40
+    maze = Maze(ROW_NUM, COL_NUM, [0, 1, 1], 'grid')
+    maze.m_items = {}
+    incremental = Knapsack(capacity, 'incremental')
+    cells = [(r, c) for r in range(ROW_NUM) for c in range(COL_NUM)]
+
+    passed = True
+    solver = None
+    for step in range(60):
+        # grow to about 40 items first, then mostly remove and reweight
+        change = rng.random()
+        if not maze.m_items or (change < 0.6 and step < 30) or change < 0.2:
+            cell = rng.choice([cell for cell in cells if cell not in maze.m_items])
+            maze.m_items[cell] = [rng.randint(1, 12), rng.randint(0, 20)]
+        elif change < 0.7:
+            del maze.m_items[rng.choice(sorted(maze.m_items))]
+        else:
+            maze.m_items[rng.choice(sorted(maze.m_items))] = [rng.randint(1, 12), rng.randint(0, 20)]
+
+        incremental.solveKnapsack(maze, None)
+        fresh = Knapsack(capacity, 'dynamic-lean')
+        fresh.solveKnapsack(maze, None)
+
+        chosen = [maze.m_items[cell] for cell in incremental.optimalCells]
+        if incremental.optimalValue != fresh.optimalValue or sum(value for _, value in chosen) != fresh.optimalValue \
+                or sum(weight for weight, _ in chosen) != incremental.optimalWeight \
+                or incremental.optimalWeight > capacity:
+            passed = report(False, f'After change {step + 1} with {len(maze.m_items)} items, incremental finds '
+                                   f'value {incremental.optimalValue}, a fresh solve {fresh.optimalValue}.') and passed
+        if solver is None:
+            solver = incremental.incremental
+        elif incremental.incremental is not solver:
+            passed = report(False, f'Change {step + 1} rebuilt the incremental table instead of updating it.') and passed
+
+    return report(passed, 'incremental matches a fresh solve after each of 60 item changes.') and passed
+
+
+def main():
+    passed = testMazeFiles()
+    passed = testGenerators() and passed
+    passed = testTiledGeneration() and passed
+    passed = testMazeCache() and passed
+    passed = testKnapsackSolvers() and passed
+    passed = testCallCounts() and passed
+    passed = testIncrementalUpdates() and passed
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()